@@ -25,33 +25,15 @@ def load_weather_data():
     if not weather_path.exists():
         weather_path = root / "data/precomputed/weather/daily_weather_scenario_001-toy.csv"
 
-    # Skip metadata header
-    with open(weather_path, "r") as f:
-        lines = f.readlines()
-
-    header_idx = 0
-    for i, line in enumerate(lines):
-        if not line.startswith("#"):
-            header_idx = i
-            break
-
-    return pd.read_csv(weather_path, skiprows=header_idx)
+    # Metadata header lines start with '#'; the C parser drops them while reading
+    return pd.read_csv(weather_path, comment="#")
 
 
 def load_building_data():
     """Load community building energy and water baseline data from building_demands factors."""
     building_path = get_project_root() / "data/building_demands/community_buildings_energy_water_factors-toy.csv"
 
-    with open(building_path, "r") as f:
-        lines = f.readlines()
-
-    header_idx = 0
-    for i, line in enumerate(lines):
-        if not line.startswith("#"):
-            header_idx = i
-            break
-
-    df = pd.read_csv(building_path, skiprows=header_idx)
+    df = pd.read_csv(building_path, comment="#")
     df.columns = df.columns.str.strip()
     return df
 
@@ -68,19 +50,11 @@ def calculate_cooling_multiplier(temp_max):
     - Above 40C: Maximum cooling (multiplier = 1.6)
 
     These multipliers affect the cooling/ventilation portion (~40% of building energy).
+    Accepts a scalar or an array of temperatures.
     """
-    if temp_max < 20:
-        return 0.5
-    elif temp_max < 25:
-        return 0.7
-    elif temp_max < 30:
-        return 0.9
-    elif temp_max < 35:
-        return 1.0
-    elif temp_max < 40:
-        return 1.3
-    else:
-        return 1.6
+    temp_max = np.asarray(temp_max)
+    bins = np.digitize(temp_max, [20, 25, 30, 35, 40])
+    return np.array([0.5, 0.7, 0.9, 1.0, 1.3, 1.6])[bins]
 
 
 def calculate_water_multiplier(temp_max):
@@ -90,13 +64,12 @@ def calculate_water_multiplier(temp_max):
     - Below 25C: Normal water use (multiplier = 1.0)
     - 25-35C: Slightly increased for cleaning (multiplier = 1.05)
     - Above 35C: Increased water use (multiplier = 1.15)
+
+    Accepts a scalar or an array of temperatures.
     """
-    if temp_max < 25:
-        return 1.0
-    elif temp_max < 35:
-        return 1.05
-    else:
-        return 1.15
+    temp_max = np.asarray(temp_max)
+    bins = np.digitize(temp_max, [25, 35])
+    return np.array([1.0, 1.05, 1.15])[bins]
 
 
 # Warehouse energy models (physics-based, reasonably insulated construction)
@@ -107,15 +80,10 @@ def calculate_non_conditioned_warehouse_kwh(base_kwh, temp_max):
     """Non-conditioned warehouse: ventilation-only. Base load with mild temp multiplier.
 
     Fans run more in hot weather. Multiplier 0.90 (cool) to 1.15 (hot).
+    Accepts a scalar or an array of temperatures.
     """
-    if temp_max < 20:
-        vent_mult = 0.90
-    elif temp_max < 28:
-        vent_mult = 1.0
-    elif temp_max < 35:
-        vent_mult = 1.08
-    else:
-        vent_mult = 1.15
+    temp_max = np.asarray(temp_max)
+    vent_mult = np.array([0.90, 1.0, 1.08, 1.15])[np.digitize(temp_max, [20, 28, 35])]
     return base_kwh * vent_mult
 
 
@@ -125,7 +93,7 @@ def calculate_conditioned_warehouse_kwh(base_non_cooling_kwh, setpoint_c, coolin
     coef derived from U (W/m²K), COP: k = U * 24 / (COP * 1000) kWh/m²/°C/day.
     Climate-controlled (20°C): U~0.55, COP 2.5 → 0.0053. Chilled (10°C): U~0.45, COP 2.0 → 0.0054.
     """
-    degree_days_above = max(0.0, temp_max - setpoint_c)
+    degree_days_above = np.maximum(0.0, np.asarray(temp_max) - setpoint_c)
     cooling_kwh = cooling_coef * degree_days_above
     return base_non_cooling_kwh + cooling_kwh
 
@@ -162,10 +130,10 @@ def generate_community_building_demand():
 
     # Get base energy and water values per building type (per m²) from factors file
     building_specs = {}
-    for _, row in buildings.iterrows():
-        building_specs[row['building_type']] = {
-            'kwh_per_m2': row['energy_per_m2_per_day_kwh'],
-            'm3_per_m2': row['water_per_m2_per_day_m3']
+    for row in buildings.itertuples(index=False):
+        building_specs[row.building_type] = {
+            'kwh_per_m2': row.energy_per_m2_per_day_kwh,
+            'm3_per_m2': row.water_per_m2_per_day_m3
         }
 
     building_types = [
@@ -188,57 +156,48 @@ def generate_community_building_demand():
     print("Output: per-m² factors only (no area assumptions)")
     print("Warehouse types: non-conditioned, climate-controlled (20°C), chilled (10°C)")
 
-    # Calculate daily factors
-    dates = weather["date"].tolist()
-    temp_max_values = weather["temp_max_c"].tolist()
-
-    energy_data = []
-    water_data = []
-
-    for date, temp_max in zip(dates, temp_max_values):
-        cooling_mult = calculate_cooling_multiplier(temp_max)
-        water_mult = calculate_water_multiplier(temp_max)
-
-        daily_energy = {"date": date}
-        daily_water = {"date": date}
-
-        for building_type in building_types:
-            specs = building_specs[building_type]
-
-            # Energy: warehouse types use physics-based model; others use cooling fraction
-            if building_type in WAREHOUSE_CONFIG:
-                cfg = WAREHOUSE_CONFIG[building_type]
-                if cfg['model'] == 'ventilation':
-                    adjusted_kwh_per_m2 = calculate_non_conditioned_warehouse_kwh(
-                        cfg['base_kwh'], temp_max
-                    )
-                else:
-                    adjusted_kwh_per_m2 = calculate_conditioned_warehouse_kwh(
-                        cfg['base_kwh'],
-                        cfg['setpoint_c'],
-                        cfg['cooling_coef'],
-                        temp_max,
-                    )
+    # Calculate daily factors: one whole-series array per building type
+    temp_max = weather["temp_max_c"].to_numpy(dtype=float)
+    cooling_mult = calculate_cooling_multiplier(temp_max)
+    water_mult = calculate_water_multiplier(temp_max)
+
+    energy_cols = {"date": weather["date"].to_numpy()}
+    water_cols = {"date": weather["date"].to_numpy()}
+
+    for building_type in building_types:
+        specs = building_specs[building_type]
+
+        # Energy: warehouse types use physics-based model; others use cooling fraction
+        if building_type in WAREHOUSE_CONFIG:
+            cfg = WAREHOUSE_CONFIG[building_type]
+            if cfg['model'] == 'ventilation':
+                adjusted_kwh_per_m2 = calculate_non_conditioned_warehouse_kwh(
+                    cfg['base_kwh'], temp_max
+                )
             else:
-                cooling_frac = cooling_fractions[building_type]
-                non_cooling_frac = 1 - cooling_frac
-                base_kwh_per_m2 = specs['kwh_per_m2']
-                adjusted_kwh_per_m2 = base_kwh_per_m2 * (
-                    non_cooling_frac + cooling_frac * cooling_mult
+                adjusted_kwh_per_m2 = calculate_conditioned_warehouse_kwh(
+                    cfg['base_kwh'],
+                    cfg['setpoint_c'],
+                    cfg['cooling_coef'],
+                    temp_max,
                 )
+        else:
+            cooling_frac = cooling_fractions[building_type]
+            non_cooling_frac = 1 - cooling_frac
+            base_kwh_per_m2 = specs['kwh_per_m2']
+            adjusted_kwh_per_m2 = base_kwh_per_m2 * (
+                non_cooling_frac + cooling_frac * cooling_mult
+            )
 
-            # Water factor: adjusted by temperature multiplier
-            adjusted_m3_per_m2 = specs['m3_per_m2'] * water_mult
-
-            daily_energy[f"{building_type}_kwh_per_m2"] = round(adjusted_kwh_per_m2, 4)
-            daily_water[f"{building_type}_m3_per_m2"] = round(adjusted_m3_per_m2, 6)
+        # Water factor: adjusted by temperature multiplier
+        adjusted_m3_per_m2 = specs['m3_per_m2'] * water_mult
 
-        energy_data.append(daily_energy)
-        water_data.append(daily_water)
+        energy_cols[f"{building_type}_kwh_per_m2"] = np.round(adjusted_kwh_per_m2, 4)
+        water_cols[f"{building_type}_m3_per_m2"] = np.round(adjusted_m3_per_m2, 6)
 
     # Create DataFrames
-    energy_df = pd.DataFrame(energy_data)
-    water_df = pd.DataFrame(water_data)
+    energy_df = pd.DataFrame(energy_cols)
+    water_df = pd.DataFrame(water_cols)
 
     # Write output files
     output_dir = get_project_root() / "data/building_demands"
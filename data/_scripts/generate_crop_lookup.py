@@ -53,7 +53,6 @@ Usage:
 import argparse
 import math
 from datetime import datetime, timedelta
-from io import StringIO
 from pathlib import Path
 
 import numpy as np
@@ -104,14 +103,7 @@ def _repo_root() -> Path:
 
 
 def read_csv_skip_comments(path: Path, **kwargs) -> pd.DataFrame:
-    data_lines: list[str] = []
-    with open(path) as f:
-        for line in f:
-            if not line.startswith("#"):
-                data_lines.append(line.rstrip("\n"))
-    if not data_lines:
-        raise ValueError(f"No data rows in {path}")
-    return pd.read_csv(StringIO("\n".join(data_lines)), **kwargs)
+    return pd.read_csv(path, comment="#", **kwargs)
 
 
 # ---------------------------------------------------------------------------
@@ -328,15 +320,12 @@ def simulate_season(
         temp_adj_c = microclimate_effects["temperature_reduction_C"]
         total_et_reduction = microclimate_effects["et_reduction_pct"] / 100.0
 
-    w = weather_df.copy()
-    w["date_dt"] = pd.to_datetime(w["date"])
-    w = w.set_index("date_dt")
+    w = weather_df.set_index("date")
 
-    scenario_ids = sorted(w["weather_scenario_id"].unique())
     rows: list[dict] = []
 
-    for scenario_id in scenario_ids:
-        w_scen = w[w["weather_scenario_id"] == scenario_id]
+    # One groupby pass splits all scenarios (keys come back sorted)
+    for scenario_id, w_scen in w.groupby("weather_scenario_id", sort=True):
         years = sorted(w_scen.index.year.unique())
 
         for year in years:
@@ -522,7 +511,7 @@ def load_weather_files(root: Path) -> dict[str, pd.DataFrame]:
     for cond, path in files.items():
         if path.exists():
             result[cond] = read_csv_skip_comments(
-                path, dtype={"weather_scenario_id": str})
+                path, dtype={"weather_scenario_id": str}, parse_dates=["date"])
     return result
 
 
@@ -557,18 +546,24 @@ def main(
     conditions = list(weather_files.keys())
     file_count = 0
 
+    # Split each parameter table by crop once instead of masking per crop
+    coeffs_by_crop = dict(tuple(coeffs.groupby("crop", sort=False)))
+    planting_by_crop = dict(tuple(planting.groupby("crop", sort=False)))
+    growth_by_crop = growth.drop_duplicates("crop").set_index("crop", drop=False)
+    yield_by_crop = yield_resp.drop_duplicates("crop").set_index("crop", drop=False)
+
     for crop_name in crops:
-        crop_coeffs = coeffs[coeffs["crop"] == crop_name].copy()
-        crop_growth = growth[growth["crop"] == crop_name].iloc[0].to_dict()
+        crop_coeffs = coeffs_by_crop.get(crop_name, coeffs.iloc[0:0]).copy()
+        crop_growth = growth_by_crop.loc[crop_name].to_dict()
         crop_growth["max_fpar"] = MAX_FPAR.get(crop_name, 0.85)
 
-        yr_row = yield_resp[yield_resp["crop"] == crop_name]
-        crop_yield_resp = (yr_row.iloc[0].to_dict() if len(yr_row) > 0
+        crop_yield_resp = (yield_by_crop.loc[crop_name].to_dict()
+                           if crop_name in yield_by_crop.index
                            else {"ky_whole_season": 1.0})
 
         optimal_frac = OPTIMAL_DEFICIT_FRACTIONS.get(crop_name, 0.80)
 
-        crop_plantings = planting[planting["crop"] == crop_name]
+        crop_plantings = planting_by_crop.get(crop_name, planting.iloc[0:0])
         crop_dir = output_dir / crop_name
         crop_dir.mkdir(parents=True, exist_ok=True)
 
@@ -26,7 +26,7 @@ from __future__ import annotations
 
 import argparse
 from datetime import datetime
-from io import StringIO
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -44,25 +44,19 @@ def _repo_root() -> Path:
 
 
 def read_csv_with_comments(path: Path) -> tuple[list[str], pd.DataFrame]:
-    """Read CSV file, returning comment lines and data DataFrame."""
-    comments: list[str] = []
-    data_lines: list[str] = []
+    """Read CSV file, returning leading comment lines and data DataFrame.
 
+    Only the '#' metadata header is scanned in Python; data rows are parsed
+    straight from the file by pandas, which skips comment lines itself.
+    """
+    comments: list[str] = []
     with open(path) as f:
         for line in f:
-            s = line.rstrip("\n")
-            if s.startswith("#"):
-                comments.append(s)
-            else:
-                data_lines.append(s)
-
-    if not data_lines:
-        raise ValueError(f"No data rows in {path}")
-
-    df = pd.read_csv(
-        StringIO("\n".join(data_lines)),
-        dtype={"weather_scenario_id": str},
-    )
+            if not line.startswith("#"):
+                break
+            comments.append(line.rstrip("\n"))
+
+    df = pd.read_csv(path, comment="#", dtype={"weather_scenario_id": str})
     return comments, df
 
 
@@ -90,20 +84,33 @@ def wind_power_curve(
     P(v) = P_rated                                           for v_rated < v ≤ v_cout
     P(v) = 0                                                 otherwise
     """
-    power = np.zeros_like(v_hub, dtype=float)
-
-    cubic_mask = (v_hub >= cut_in_ms) & (v_hub <= rated_ms)
-    power[cubic_mask] = rated_capacity_kw * (
-        (v_hub[cubic_mask] ** 3 - cut_in_ms**3)
-        / (rated_ms**3 - cut_in_ms**3)
+    # Cubic fraction clipped to [0, 1] covers below cut-in, cubic and rated
+    # regions in one pass; only the cut-out shutdown needs a separate mask.
+    fraction = np.clip(
+        (v_hub**3 - cut_in_ms**3) / (rated_ms**3 - cut_in_ms**3), 0.0, 1.0
     )
-
-    rated_mask = (v_hub > rated_ms) & (v_hub <= cut_out_ms)
-    power[rated_mask] = rated_capacity_kw
+    power = rated_capacity_kw * fraction
+    power[v_hub > cut_out_ms] = 0.0
 
     return power
 
 
+@lru_cache(maxsize=16)
+def _power_grid(
+    rated_capacity_kw: float,
+    cut_in_ms: float,
+    rated_ms: float,
+    cut_out_ms: float,
+    n_points: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the (read-only) integration speed grid and power curve for one turbine spec."""
+    v_grid = np.linspace(0, cut_out_ms * 1.5, n_points)
+    power_grid = wind_power_curve(v_grid, rated_capacity_kw, cut_in_ms, rated_ms, cut_out_ms)
+    v_grid.flags.writeable = False
+    power_grid.flags.writeable = False
+    return v_grid, power_grid
+
+
 def expected_wind_power_rayleigh(
     v_mean: np.ndarray,
     rated_capacity_kw: float,
@@ -130,17 +137,14 @@ def expected_wind_power_rayleigh(
         Array of expected power values (kW).
     """
     results = np.zeros_like(v_mean, dtype=float)
-    v_grid = np.linspace(0, cut_out_ms * 1.5, n_points)
-    power_grid = wind_power_curve(v_grid, rated_capacity_kw, cut_in_ms, rated_ms, cut_out_ms)
+    v_grid, power_grid = _power_grid(rated_capacity_kw, cut_in_ms, rated_ms, cut_out_ms, n_points)
 
-    for i, vm in enumerate(v_mean):
-        if vm < 0.5:  # negligible wind
-            continue
-        # Rayleigh PDF: f(v) = (v / sigma^2) * exp(-v^2 / (2*sigma^2))
-        # where sigma = v_mean * sqrt(2/pi)
-        sigma = vm * np.sqrt(2 / np.pi)
-        pdf = (v_grid / sigma**2) * np.exp(-v_grid**2 / (2 * sigma**2))
-        results[i] = np.trapezoid(power_grid * pdf, v_grid)
+    windy = np.asarray(v_mean) >= 0.5  # below this, wind is negligible
+    # Rayleigh PDF: f(v) = (v / sigma^2) * exp(-v^2 / (2*sigma^2))
+    # where sigma = v_mean * sqrt(2/pi); one row per day, one column per grid speed
+    sigma = np.asarray(v_mean)[windy, np.newaxis] * np.sqrt(2 / np.pi)
+    pdf = (v_grid / sigma**2) * np.exp(-v_grid**2 / (2 * sigma**2))
+    results[windy] = np.trapezoid(power_grid * pdf, v_grid, axis=1)
 
     return results
 
@@ -153,17 +157,17 @@ def compute_wind_output(
     result = weather_df[["date"]].copy()
     v_10m = weather_df["wind_speed_ms"].values
 
-    for _, turbine in turbines_df.iterrows():
-        v_hub = wind_speed_at_hub(v_10m, turbine["hub_height_m"])
+    for turbine in turbines_df.itertuples(index=False):
+        v_hub = wind_speed_at_hub(v_10m, turbine.hub_height_m)
         avg_power_kw = expected_wind_power_rayleigh(
             v_hub,
-            turbine["rated_capacity_kw"],
-            turbine["cut_in_speed_ms"],
-            turbine["rated_speed_ms"],
-            turbine["cut_out_speed_ms"],
+            turbine.rated_capacity_kw,
+            turbine.cut_in_speed_ms,
+            turbine.rated_speed_ms,
+            turbine.cut_out_speed_ms,
         )
-        col = f"{turbine['turbine_name']}_turbine_kwh"
-        daily_kwh = avg_power_kw * HOURS_PER_DAY * (1 - turbine["system_losses_pct"] / 100)
+        col = f"{turbine.turbine_name}_turbine_kwh"
+        daily_kwh = avg_power_kw * HOURS_PER_DAY * (1 - turbine.system_losses_pct / 100)
         result[col] = np.round(daily_kwh, 2)
 
     return result
@@ -179,29 +183,29 @@ def compute_pv_output(
     pv_df: pd.DataFrame,
 ) -> pd.DataFrame:
     """Compute daily PV energy output (kWh/hectare/day) for each density level."""
-    result = weather_df[["date"]].copy()
-
-    ghi = weather_df["solar_irradiance_kwh_m2"].values
-    t_avg = (weather_df["temp_max_c"].values + weather_df["temp_min_c"].values) / 2
-
-    for _, pv in pv_df.iterrows():
-        panel_area_per_ha = (pv["ground_coverage_pct"] / 100) * HECTARE_M2
-        t_cell = t_avg + pv["temp_adjustment_c"]
-        temp_derate = 1 + pv["temp_coefficient_per_c"] * (t_cell - pv["temp_reference_c"])
-
-        daily_kwh = (
-            ghi
-            * panel_area_per_ha
-            * pv["module_efficiency"]
-            * pv["tilt_factor"]
-            * pv["irradiance_factor"]
-            * temp_derate
-            * (1 - pv["system_losses_pct"] / 100)
-            * pv["shading_factor"]
-        )
+    # Broadcast (days, 1) weather against (densities,) parameters so every
+    # density variant is computed in one pass instead of a per-row loop
+    ghi = weather_df["solar_irradiance_kwh_m2"].to_numpy()[:, None]
+    t_avg = ((weather_df["temp_max_c"].to_numpy() + weather_df["temp_min_c"].to_numpy()) / 2)[:, None]
+
+    panel_area_per_ha = (pv_df["ground_coverage_pct"].to_numpy() / 100) * HECTARE_M2
+    t_cell = t_avg + pv_df["temp_adjustment_c"].to_numpy()
+    temp_derate = 1 + pv_df["temp_coefficient_per_c"].to_numpy() * (t_cell - pv_df["temp_reference_c"].to_numpy())
+
+    daily_kwh = (
+        ghi
+        * panel_area_per_ha
+        * pv_df["module_efficiency"].to_numpy()
+        * pv_df["tilt_factor"].to_numpy()
+        * pv_df["irradiance_factor"].to_numpy()
+        * temp_derate
+        * (1 - pv_df["system_losses_pct"].to_numpy() / 100)
+        * pv_df["shading_factor"].to_numpy()
+    )
 
-        col = f"{pv['density_name']}_density_kwh_per_ha"
-        result[col] = np.round(daily_kwh, 2)
+    cols = [f"{name}_density_kwh_per_ha" for name in pv_df["density_name"]]
+    result = pd.DataFrame(np.round(daily_kwh, 2), columns=cols, index=weather_df.index)
+    result.insert(0, "date", weather_df["date"])
 
     return result
 
@@ -213,12 +217,12 @@ def compute_pv_output(
 
 def wind_metadata_header(turbines_df: pd.DataFrame, date_str: str) -> str:
     turbine_specs = "; ".join(
-        f"{r['turbine_name']}={r['product_name']} "
-        f"({r['rated_capacity_kw']}kW, hub {r['hub_height_m']}m, "
-        f"rotor {r['rotor_diameter_m']}m, losses {r['system_losses_pct']}%)"
-        for _, r in turbines_df.iterrows()
+        f"{r.turbine_name}={r.product_name} "
+        f"({r.rated_capacity_kw}kW, hub {r.hub_height_m}m, "
+        f"rotor {r.rotor_diameter_m}m, losses {r.system_losses_pct}%)"
+        for r in turbines_df.itertuples(index=False)
     )
-    cols = ", ".join(f"{r['turbine_name']}_turbine_kwh" for _, r in turbines_df.iterrows())
+    cols = ", ".join(f"{name}_turbine_kwh" for name in turbines_df["turbine_name"])
     return (
         f"# SOURCE: Derived from wind_turbines-research.csv and daily_weather_openfield-research.csv\n"
         f"# DATE: {date_str}\n"
@@ -240,11 +244,11 @@ def wind_metadata_header(turbines_df: pd.DataFrame, date_str: str) -> str:
 
 def pv_metadata_header(pv_df: pd.DataFrame, date_str: str) -> str:
     density_specs = "; ".join(
-        f"{r['density_name']}=GCR {r['ground_coverage_pct']}%, "
-        f"shading {r['shading_factor']}, temp_adj {r['temp_adjustment_c']:+.1f}C"
-        for _, r in pv_df.iterrows()
+        f"{r.density_name}=GCR {r.ground_coverage_pct}%, "
+        f"shading {r.shading_factor}, temp_adj {r.temp_adjustment_c:+.1f}C"
+        for r in pv_df.itertuples(index=False)
     )
-    cols = ", ".join(f"{r['density_name']}_density_kwh_per_ha" for _, r in pv_df.iterrows())
+    cols = ", ".join(f"{name}_density_kwh_per_ha" for name in pv_df["density_name"])
     return (
         f"# SOURCE: Derived from pv_systems-research.csv and daily_weather_openfield-research.csv\n"
         f"# DATE: {date_str}\n"
@@ -23,33 +23,15 @@ def load_weather_data():
     if not weather_path.exists():
         weather_path = root / "data/precomputed/weather/daily_weather_scenario_001-toy.csv"
 
-    # Skip metadata header
-    with open(weather_path, "r") as f:
-        lines = f.readlines()
-
-    header_idx = 0
-    for i, line in enumerate(lines):
-        if not line.startswith("#"):
-            header_idx = i
-            break
-
-    return pd.read_csv(weather_path, skiprows=header_idx)
+    # Metadata header lines start with '#'; the C parser drops them while reading
+    return pd.read_csv(weather_path, comment="#")
 
 
 def load_housing_data():
     """Load housing energy and water baseline data from building_demands factors."""
     housing_path = get_project_root() / "data/building_demands/housing_energy_water_factors-toy.csv"
 
-    with open(housing_path, "r") as f:
-        lines = f.readlines()
-
-    header_idx = 0
-    for i, line in enumerate(lines):
-        if not line.startswith("#"):
-            header_idx = i
-            break
-
-    df = pd.read_csv(housing_path, skiprows=header_idx)
+    df = pd.read_csv(housing_path, comment="#")
     # Normalize column names (factors use energy_per_household_per_day_kWh, water_per_household_per_day_m3)
     df.columns = df.columns.str.strip()
     return df
@@ -66,17 +48,11 @@ def calculate_ac_multiplier(temp_max):
     - Above 40C: Full AC use (multiplier = 1.4)
 
     These multipliers affect the AC portion of energy use (~40-60% of household energy).
+    Accepts a scalar or an array of temperatures.
     """
-    if temp_max < 25:
-        return 0.6
-    elif temp_max < 30:
-        return 0.8
-    elif temp_max < 35:
-        return 1.0
-    elif temp_max < 40:
-        return 1.2
-    else:
-        return 1.4
+    temp_max = np.asarray(temp_max)
+    bins = np.digitize(temp_max, [25, 30, 35, 40])
+    return np.array([0.6, 0.8, 1.0, 1.2, 1.4])[bins]
 
 
 def calculate_water_multiplier(temp_max):
@@ -86,13 +62,12 @@ def calculate_water_multiplier(temp_max):
     - Below 25C: Slightly reduced water use (multiplier = 0.95)
     - 25-35C: Normal water use (multiplier = 1.0)
     - Above 35C: Increased water use (multiplier = 1.1)
+
+    Accepts a scalar or an array of temperatures.
     """
-    if temp_max < 25:
-        return 0.95
-    elif temp_max < 35:
-        return 1.0
-    else:
-        return 1.1
+    temp_max = np.asarray(temp_max)
+    bins = np.digitize(temp_max, [25, 35])
+    return np.array([0.95, 1.0, 1.1])[bins]
 
 
 def generate_household_demand():
@@ -125,56 +100,46 @@ def generate_household_demand():
 
     print(f"Processing {len(weather)} days of weather data...")
 
-    # Calculate daily values
-    dates = weather["date"].tolist()
-    temp_max_values = weather["temp_max_c"].tolist()
-
-    energy_data = []
-    water_data = []
-
-    for date, temp_max in zip(dates, temp_max_values):
-        ac_mult = calculate_ac_multiplier(temp_max)
-        water_mult = calculate_water_multiplier(temp_max)
-
-        # Energy: base non-AC portion + AC portion adjusted by multiplier
-        non_ac_fraction = 1 - ac_fraction
-
-        small_kwh = small_base_kwh * (non_ac_fraction + ac_fraction * ac_mult)
-        medium_kwh = medium_base_kwh * (non_ac_fraction + ac_fraction * ac_mult)
-        large_kwh = large_base_kwh * (non_ac_fraction + ac_fraction * ac_mult)
-
-        total_community_kwh = (small_count * small_kwh +
-                               medium_count * medium_kwh +
-                               large_count * large_kwh)
-
-        energy_data.append({
-            "date": date,
-            "small_household_kwh": round(small_kwh, 2),
-            "medium_household_kwh": round(medium_kwh, 2),
-            "large_household_kwh": round(large_kwh, 2),
-            "total_community_kwh": round(total_community_kwh, 2),
-        })
-
-        # Water: adjusted by temperature multiplier
-        small_m3 = small_base_m3 * water_mult
-        medium_m3 = medium_base_m3 * water_mult
-        large_m3 = large_base_m3 * water_mult
-
-        total_community_m3 = (small_count * small_m3 +
-                              medium_count * medium_m3 +
-                              large_count * large_m3)
-
-        water_data.append({
-            "date": date,
-            "small_household_m3": round(small_m3, 3),
-            "medium_household_m3": round(medium_m3, 3),
-            "large_household_m3": round(large_m3, 3),
-            "total_community_m3": round(total_community_m3, 2),
-        })
-
-    # Create DataFrames
-    energy_df = pd.DataFrame(energy_data)
-    water_df = pd.DataFrame(water_data)
+    # Calculate daily values for all days at once
+    temp_max = weather["temp_max_c"].to_numpy(dtype=float)
+    ac_mult = calculate_ac_multiplier(temp_max)
+    water_mult = calculate_water_multiplier(temp_max)
+
+    # Energy: base non-AC portion + AC portion adjusted by multiplier
+    non_ac_fraction = 1 - ac_fraction
+
+    small_kwh = small_base_kwh * (non_ac_fraction + ac_fraction * ac_mult)
+    medium_kwh = medium_base_kwh * (non_ac_fraction + ac_fraction * ac_mult)
+    large_kwh = large_base_kwh * (non_ac_fraction + ac_fraction * ac_mult)
+
+    total_community_kwh = (small_count * small_kwh +
+                           medium_count * medium_kwh +
+                           large_count * large_kwh)
+
+    energy_df = pd.DataFrame({
+        "date": weather["date"].to_numpy(),
+        "small_household_kwh": np.round(small_kwh, 2),
+        "medium_household_kwh": np.round(medium_kwh, 2),
+        "large_household_kwh": np.round(large_kwh, 2),
+        "total_community_kwh": np.round(total_community_kwh, 2),
+    })
+
+    # Water: adjusted by temperature multiplier
+    small_m3 = small_base_m3 * water_mult
+    medium_m3 = medium_base_m3 * water_mult
+    large_m3 = large_base_m3 * water_mult
+
+    total_community_m3 = (small_count * small_m3 +
+                          medium_count * medium_m3 +
+                          large_count * large_m3)
+
+    water_df = pd.DataFrame({
+        "date": weather["date"].to_numpy(),
+        "small_household_m3": np.round(small_m3, 3),
+        "medium_household_m3": np.round(medium_m3, 3),
+        "large_household_m3": np.round(large_m3, 3),
+        "total_community_m3": np.round(total_community_m3, 2),
+    })
 
     # Write output files
     output_dir = get_project_root() / "data/building_demands"
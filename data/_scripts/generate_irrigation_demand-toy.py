@@ -48,26 +48,21 @@ def _load_crop_tds(params_path):
 
 
 def _load_daily_etc(growth_dir, crop, planting):
-    """Load daily ETc from growth file, filter to full_eto, average by calendar day.
+    """Load daily ETc from growth file, filtered to full_eto.
 
     Returns:
-        DataFrame with columns: month, dom, {crop}_etc_mm_per_ha
+        DataFrame with columns: month, dom, etc_mm (one row per simulated day)
     """
     path = growth_dir / crop / f"{crop}_{planting}_{CONDITION}-research.csv"
-    df = pd.read_csv(path, comment="#")
+    df = pd.read_csv(path, comment="#", parse_dates=["date"])
     df = df[df["irrigation_policy"] == IRRIGATION_POLICY]
 
-    dates = pd.to_datetime(df["date"])
-    col = f"{crop}_etc_mm_per_ha"
-
-    avg = (
-        pd.DataFrame({"month": dates.dt.month, "dom": dates.dt.day, col: df["etc_mm"].values})
-        .groupby(["month", "dom"])[col]
-        .mean()
-        .reset_index()
-    )
-    avg[col] = avg[col].round(2)
-    return avg
+    dates = df["date"]
+    return pd.DataFrame({
+        "month": dates.dt.month.astype("int8"),
+        "dom": dates.dt.day.astype("int8"),
+        "etc_mm": df["etc_mm"].values,
+    })
 
 
 def _build_calendar():
@@ -75,8 +70,8 @@ def _build_calendar():
     dates = pd.date_range("2023-01-01", "2023-12-31", freq="D")
     return pd.DataFrame({
         "month_day": dates.strftime("%m-%d"),
-        "month": dates.month,
-        "dom": dates.day,
+        "month": dates.month.astype("int8"),
+        "dom": dates.day.astype("int8"),
     })
 
 
@@ -85,13 +80,24 @@ def build_demand_profile(growth_dir, params_path):
     crop_tds = _load_crop_tds(params_path)
     cal = _build_calendar()
 
-    etc_cols = []
-    for crop, planting in ROTATION:
-        avg = _load_daily_etc(growth_dir, crop, planting)
-        col = f"{crop}_etc_mm_per_ha"
-        etc_cols.append(col)
-        cal = cal.merge(avg, on=["month", "dom"], how="left")
-        cal[col] = cal[col].fillna(0.0)
+    etc_cols = [f"{crop}_etc_mm_per_ha" for crop, _ in ROTATION]
+    daily = pd.concat(
+        [
+            _load_daily_etc(growth_dir, crop, planting).assign(column=col)
+            for (crop, planting), col in zip(ROTATION, etc_cols)
+        ],
+        ignore_index=True,
+    )
+
+    # Average every crop by calendar day in one groupby, then align to the calendar once
+    avg = (
+        daily.groupby(["month", "dom", "column"])["etc_mm"]
+        .mean()
+        .unstack("column")
+        .round(2)
+    )
+    cal = cal.join(avg[etc_cols], on=["month", "dom"])
+    cal[etc_cols] = cal[etc_cols].fillna(0.0)
 
     cal["total_etc_mm_per_ha"] = cal[etc_cols].sum(axis=1).round(2)
 
@@ -32,27 +32,19 @@ def _repo_root() -> Path:
 
 
 def read_csv_with_comments(path: Path) -> tuple[list[str], pd.DataFrame]:
-    """Read CSV file, returning comment lines and data DataFrame."""
-    comments = []
-    data_lines = []
+    """Read CSV file, returning leading comment lines and data DataFrame.
 
-    with open(path, "r") as f:
+    Only the '#' metadata header is scanned in Python; data rows are parsed
+    straight from the file by pandas, which skips comment lines itself.
+    """
+    comments: list[str] = []
+    with open(path) as f:
         for line in f:
-            s = line.rstrip("\n")
-            if s.startswith("#"):
-                comments.append(s)
-            else:
-                data_lines.append(s)
+            if not line.startswith("#"):
+                break
+            comments.append(line.rstrip("\n"))
 
-    if not data_lines:
-        raise ValueError(f"No data rows in {path}")
-
-    from io import StringIO
-
-    df = pd.read_csv(
-        StringIO("\n".join(data_lines)),
-        dtype={"weather_scenario_id": str},
-    )
+    df = pd.read_csv(path, comment="#", dtype={"weather_scenario_id": str})
     return comments, df
 
 
@@ -15,9 +15,12 @@ Usage:
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import yaml
 
+from src.data_loaders import load_daily_csv, load_registry
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -29,11 +32,6 @@ def _load_yaml(path):
         return yaml.safe_load(f)
 
 
-def _load_csv(path):
-    """Load CSV, skipping comment lines that start with '#', parsing 'date' column."""
-    return pd.read_csv(path, comment='#', parse_dates=['date'])
-
-
 def _resolve_paths(registry, root_dir):
     """Resolve relative data paths from registry to absolute paths.
 
@@ -47,6 +45,29 @@ def _resolve_paths(registry, root_dir):
     return {k: Path(root_dir) / v for k, v in registry['building_demands'].items()}
 
 
+def _scale_unit_columns(df, units, src_suffix, out_suffix, scale_key, multiplier_key):
+    """Scale per-unit demand columns by their config factors in one array operation.
+
+    Args:
+        df: DataFrame with per-unit demand columns named '{unit_type}_{src_suffix}'.
+        units: Dict mapping unit type to its config dict.
+        src_suffix: Column suffix in source data.
+        out_suffix: Column suffix for output.
+        scale_key: Config key for the unit count or area.
+        multiplier_key: Config key for the optional demand multiplier.
+
+    Returns:
+        DataFrame with one scaled total column per unit type.
+    """
+    counts = np.array([cfg[scale_key] for cfg in units.values()], dtype=float)
+    multipliers = np.array([cfg.get(multiplier_key, 1.0) for cfg in units.values()], dtype=float)
+    src_cols = [f'{unit_type}_{src_suffix}' for unit_type in units]
+    # (days, types) matrix scaled column-wise by broadcasting the per-type factors
+    scaled = df[src_cols].to_numpy(dtype=float) * counts * multipliers
+    return pd.DataFrame(scaled, columns=[f'{unit_type}_{out_suffix}' for unit_type in units],
+                        index=df.index)
+
+
 def _scale_households(df, households, src_suffix, out_suffix, scale_key, multiplier_key):
     """Scale per-unit household demand to community totals for one resource type.
 
@@ -61,15 +82,7 @@ def _scale_households(df, households, src_suffix, out_suffix, scale_key, multipl
     Returns:
         DataFrame with one scaled total column per household type.
     """
-    cols = {
-        f'{hh_type}_{out_suffix}': (
-            df[f'{hh_type}_{src_suffix}']
-            * cfg[scale_key]
-            * cfg.get(multiplier_key, 1.0)
-        )
-        for hh_type, cfg in households.items()
-    }
-    return pd.DataFrame(cols)
+    return _scale_unit_columns(df, households, src_suffix, out_suffix, scale_key, multiplier_key)
 
 
 def _scale_buildings(df, buildings, src_suffix, out_suffix, scale_key, multiplier_key):
@@ -86,15 +99,7 @@ def _scale_buildings(df, buildings, src_suffix, out_suffix, scale_key, multiplie
     Returns:
         DataFrame with one scaled total column per building type.
     """
-    cols = {
-        f'{bld_type}_{out_suffix}': (
-            df[f'{bld_type}_{src_suffix}']
-            * cfg[scale_key]
-            * cfg.get(multiplier_key, 1.0)
-        )
-        for bld_type, cfg in buildings.items()
-    }
-    return pd.DataFrame(cols)
+    return _scale_unit_columns(df, buildings, src_suffix, out_suffix, scale_key, multiplier_key)
 
 
 def _add_totals(df, hh_energy_cols, hh_water_cols, bld_energy_cols, bld_water_cols):
@@ -152,16 +157,16 @@ def compute_daily_demands(config_path, registry_path, *, root_dir=None):
         root_dir = Path(registry_path).parent.parent
 
     config = _load_yaml(config_path)
-    registry = _load_yaml(registry_path)
+    registry = load_registry(registry_path)
     paths = _resolve_paths(registry, root_dir)
 
     households = config['households']
     buildings = config['community_buildings']
 
-    hh_energy_df = _load_csv(paths['household_energy'])
-    hh_water_df = _load_csv(paths['household_water'])
-    bld_energy_df = _load_csv(paths['buildings_energy'])
-    bld_water_df = _load_csv(paths['buildings_water'])
+    hh_energy_df = load_daily_csv(paths['household_energy'])
+    hh_water_df = load_daily_csv(paths['household_water'])
+    bld_energy_df = load_daily_csv(paths['buildings_energy'])
+    bld_water_df = load_daily_csv(paths['buildings_water'])
 
     # validate date alignment across all four building demand CSVs before concat
     _ref_dates = hh_energy_df['date'].values
@@ -37,7 +37,8 @@ import numpy as np
 import pandas as pd
 import yaml
 
-from src.farm_profile import normalize_plantings, planting_code_to_mmdd, _load_season_lengths
+from src.data_loaders import load_crop_params, load_growth_csv, load_registry
+from src.farm_profile import planting_code_to_mmdd, _load_season_lengths
 
 
 # ---------------------------------------------------------------------------
@@ -65,12 +66,10 @@ def _load_yield_params(registry, root_dir, crop):
         dict with keys: potential_yield_kg_per_ha, ky_whole_season, wue_curvature.
     """
     yrf_path = root_dir / registry['crops']['yield_response_factors']
-    yrf_df = pd.read_csv(yrf_path, comment='#')
-    yrf_row = yrf_df[yrf_df['crop'] == crop].iloc[0]
+    yrf_row = load_crop_params(yrf_path)[crop]
 
     cgp_path = root_dir / registry['crops']['growth_params']
-    cgp_df = pd.read_csv(cgp_path, comment='#')
-    cgp_row = cgp_df[cgp_df['crop'] == crop].iloc[0]
+    cgp_row = load_crop_params(cgp_path)[crop]
 
     return {
         'potential_yield_kg_per_ha': cgp_row['potential_yield_kg_per_ha'],
@@ -96,8 +95,7 @@ def _load_season_kt(growth_dir, crop, planting, condition, weather_year):
     Returns:
         pd.Series of temp_stress_coeff indexed by pd.DatetimeIndex.
     """
-    path = growth_dir / crop / f"{crop}_{planting}_{condition}-research.csv"
-    df = pd.read_csv(path, comment='#', parse_dates=['date'])
+    df = load_growth_csv(growth_dir, crop, planting, condition)
     df = df[(df['irrigation_policy'] == 'full_eto') & (df['weather_year'] == weather_year)]
     return df.set_index('date')['temp_stress_coeff']
 
@@ -137,7 +135,7 @@ def compute_harvest_yield(crop, planting, condition, weather_year,
         root_dir = registry_path.parent.parent
     root_dir = Path(root_dir)
 
-    registry = _load_yaml(registry_path)
+    registry = load_registry(registry_path)
 
     # 2. Load yield params
     params = _load_yield_params(registry, root_dir, crop)
@@ -180,11 +178,17 @@ def compute_harvest_yield(crop, planting, condition, weather_year,
     return float(yield_kg_ha)
 
 
-def _build_daily_harvest_df(harvest_records, sim_start, sim_end):
-    """Pivot harvest records into a daily DataFrame with per-field-crop columns.
+_HARVEST_COLUMNS = [
+    'harvest_date', 'field', 'crop', 'planting', 'condition',
+    'yield_kg_per_ha', 'area_ha', 'harvest_kg',
+]
+
+
+def _build_daily_harvest_df(harvests_df, sim_start, sim_end):
+    """Pivot harvest events into a daily DataFrame with per-field-crop columns.
 
     Args:
-        harvest_records: List of dicts with harvest_date, field, crop, harvest_kg.
+        harvests_df: DataFrame with harvest_date, field, crop, harvest_kg columns.
         sim_start: First day of simulation (pd.Timestamp).
         sim_end: Last day of simulation (pd.Timestamp).
 
@@ -192,20 +196,19 @@ def _build_daily_harvest_df(harvest_records, sim_start, sim_end):
         DataFrame with 'day' plus '{field}_{crop}_harvest_kg' columns and
         'total_harvest_kg'.
     """
-    all_days = pd.DataFrame({'day': pd.date_range(sim_start, sim_end, freq='D')})
-
-    # Accumulate harvest_kg per (date, field_crop column)
-    field_crop_values = {}
-    for rec in harvest_records:
-        col = f"{rec['field']}_{rec['crop']}_harvest_kg"
-        if col not in field_crop_values:
-            field_crop_values[col] = {}
-        d = rec['harvest_date']
-        field_crop_values[col][d] = field_crop_values[col].get(d, 0) + rec['harvest_kg']
-
-    daily_df = all_days.copy()
-    for col in sorted(field_crop_values):
-        daily_df[col] = daily_df['day'].map(field_crop_values[col]).fillna(0.0).round(1)
+    days = pd.date_range(sim_start, sim_end, freq='D')
+    daily_df = pd.DataFrame({'day': days})
+
+    if not harvests_df.empty:
+        # Sum harvest_kg per (date, field_crop column) into a day x column grid
+        records = harvests_df.assign(
+            column=harvests_df['field'] + '_' + harvests_df['crop'] + '_harvest_kg')
+        grid = (records.groupby(['harvest_date', 'column'])['harvest_kg'].sum()
+                .unstack('column')
+                .reindex(index=days, columns=sorted(records['column'].unique()))
+                .fillna(0.0)
+                .round(1))
+        daily_df = pd.concat([daily_df, grid.reset_index(drop=True)], axis=1)
 
     harvest_cols = [c for c in daily_df.columns if c.endswith('_harvest_kg')]
     daily_df['total_harvest_kg'] = daily_df[harvest_cols].sum(axis=1).round(1)
@@ -243,11 +246,15 @@ def compute_community_harvest(water_balance_df, *, farm_profiles_path,
     root_dir = Path(root_dir)
 
     farm_config = _load_yaml(farm_profiles_path)
-    registry = _load_yaml(registry_path)
+    registry = load_registry(registry_path)
     season_lookup = _load_season_lengths(registry, root_dir)
 
-    sim_start = water_balance_df['day'].min()
-    sim_end = water_balance_df['day'].max()
+    # Seasons are sliced positionally via searchsorted, which needs sorted days
+    if not water_balance_df['day'].is_monotonic_increasing:
+        water_balance_df = water_balance_df.sort_values('day', kind='stable')
+    days = pd.DatetimeIndex(water_balance_df['day'])
+    sim_start = days[0]
+    sim_end = days[-1]
 
     harvest_records = []
     for farm in farm_config['farms']:
@@ -271,9 +278,9 @@ def compute_community_harvest(water_balance_df, *, farm_profiles_path,
                         if harvest_date > sim_end or harvest_date <= sim_start:
                             continue
 
-                        mask = (water_balance_df['day'] >= planting_date) & (
-                            water_balance_df['day'] < harvest_date)
-                        season_df = water_balance_df.loc[mask]
+                        lo = days.searchsorted(planting_date)
+                        hi = days.searchsorted(harvest_date)
+                        season_df = water_balance_df.iloc[lo:hi]
                         if season_df.empty:
                             continue
 
@@ -294,19 +301,14 @@ def compute_community_harvest(water_balance_df, *, farm_profiles_path,
                             root_dir=root_dir,
                         )
 
-                        harvest_records.append({
-                            'harvest_date': harvest_date,
-                            'field': field_name,
-                            'crop': crop,
-                            'planting': planting_code,
-                            'condition': condition,
-                            'yield_kg_per_ha': round(yield_kg_ha, 1),
-                            'area_ha': area_ha,
-                            'harvest_kg': round(yield_kg_ha * area_ha, 1),
-                        })
-
-    daily_df = _build_daily_harvest_df(harvest_records, sim_start, sim_end)
-    harvests_df = pd.DataFrame(harvest_records)
+                        harvest_records.append((
+                            harvest_date, field_name, crop, planting_code,
+                            condition, round(yield_kg_ha, 1), area_ha,
+                            round(yield_kg_ha * area_ha, 1),
+                        ))
+
+    harvests_df = pd.DataFrame.from_records(harvest_records, columns=_HARVEST_COLUMNS)
+    daily_df = _build_daily_harvest_df(harvests_df, sim_start, sim_end)
 
     return daily_df, harvests_df
 
@@ -0,0 +1,117 @@
+"""Data file loaders shared by the simulation modules.
+
+Every simulation module resolves its data paths from the data registry, and
+crop_yield loads it once per harvest event, so the parsed registry and the
+per-crop parameter CSVs are cached.
+Daily series CSVs (community demand, energy output) are recomputed by the
+water balance, energy balance and planting optimizer, so they are parsed once
+and cached. Crop growth CSVs are read by crop yield, irrigation demand and the
+planting optimizer, so the file naming and column dtypes are defined once here.
+
+Usage:
+    from src.data_loaders import (
+        load_crop_params, load_daily_csv, load_growth_csv, load_registry,
+    )
+
+    registry = load_registry('settings/data_registry_base.yaml')
+    params = load_crop_params('data/crops/crop_params/crop_growth_params-research.csv')
+    df = load_daily_csv('data/building_demands/household_water_m3_per_day-toy.csv')
+    df = load_growth_csv(growth_dir, 'tomato', 'oct01', 'openfield')
+"""
+
+import copy
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+import yaml
+
+# Repeated string labels in crop growth CSVs, parsed as categoricals so the
+# per-file policy filter compares integer codes
+GROWTH_DTYPES = {"irrigation_policy": "category", "growth_stage": "category"}
+
+
+@lru_cache(maxsize=8)
+def _load_registry_cached(path, mtime_ns):
+    """Parse the data registry once per (path, modification time)."""
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+def load_registry(registry_path):
+    """Load the data registry, re-parsing only when the file has changed.
+
+    Each caller gets its own deep copy, so changing it cannot affect later
+    calls.
+
+    Args:
+        registry_path: Path to data_registry YAML.
+
+    Returns:
+        Parsed data_registry dict.
+    """
+    path = Path(registry_path).resolve()
+    return copy.deepcopy(_load_registry_cached(path, path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=16)
+def _load_crop_params_cached(path, mtime_ns):
+    """Parse a per-crop parameter CSV into a crop -> row dict once per (path, mtime)."""
+    df = pd.read_csv(path, comment="#")
+    # First row per crop wins, matching a boolean-mask lookup followed by .iloc[0]
+    return df.drop_duplicates("crop").set_index("crop").to_dict(orient="index")
+
+
+def load_crop_params(path):
+    """Load a per-crop parameter CSV as a crop -> row dict lookup.
+
+    Re-parses only when the file has changed, so each season's parameter
+    lookup is a dict access rather than a boolean-mask scan. Each caller gets
+    its own deep copy, so changing it cannot affect later calls.
+
+    Args:
+        path: Path to a CSV with one row per crop and a 'crop' column.
+
+    Returns:
+        Dict mapping crop name to a dict of that crop's column values.
+    """
+    path = Path(path).resolve()
+    return copy.deepcopy(_load_crop_params_cached(path, path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _load_daily_csv_cached(path, mtime_ns):
+    """Parse a daily series CSV once per (path, modification time)."""
+    return pd.read_csv(path, comment="#", parse_dates=["date"], date_format="%Y-%m-%d")
+
+
+def load_daily_csv(path):
+    """Load a daily series CSV with a 'date' column, skipping '#' comment lines.
+
+    The parsed frame is cached and re-read only when the file changes. Each
+    caller gets its own copy, so changing it cannot affect later calls.
+
+    Args:
+        path: Path to the CSV file.
+
+    Returns:
+        DataFrame with a parsed 'date' column.
+    """
+    path = Path(path).resolve()
+    return _load_daily_csv_cached(path, path.stat().st_mtime_ns).copy()
+
+
+def load_growth_csv(growth_dir, crop, planting, condition):
+    """Load the daily growth CSV for one (crop, planting, condition) triple.
+
+    Args:
+        growth_dir: Directory holding one sub-directory of growth CSVs per crop.
+        crop: Crop name string (e.g. 'tomato').
+        planting: Planting code (e.g. 'oct01').
+        condition: Growing condition (e.g. 'openfield', 'underpv_low').
+
+    Returns:
+        DataFrame of daily growth rows with a parsed 'date' column.
+    """
+    path = growth_dir / crop / f"{crop}_{planting}_{condition}-research.csv"
+    return pd.read_csv(path, comment="#", parse_dates=["date"], dtype=GROWTH_DTYPES)
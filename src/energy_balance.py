@@ -33,6 +33,8 @@ from pathlib import Path
 import pandas as pd
 import yaml
 
+from src.data_loaders import load_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,8 +85,10 @@ def _load_price_series(csv_path, column):
     Returns:
         Series indexed by date with the specified column's values.
     """
-    df = pd.read_csv(csv_path, comment='#', parse_dates=['date'])
-    return df.set_index('date')[column]
+    # Price files carry several rate columns; parse only the one requested
+    df = pd.read_csv(csv_path, comment='#', usecols=['date', column],
+                     parse_dates=['date'], index_col='date')
+    return df[column]
 
 
 def _daily_price_lookup(price_series, dates):
@@ -207,6 +211,10 @@ def _build_generator_specs(energy_system_config, policy_config, equipment_path):
 # Internal helpers — grid validation and export rate
 # ---------------------------------------------------------------------------
 
+# User-facing energy_policy strategy names; _SURPLUS_ORDER and _DEFICIT_ORDER
+# must define an action order for exactly these
+_VALID_STRATEGIES = ('minimize_cost', 'minimize_grid_reliance', 'minimize_generator')
+
 _VALID_GRID_MODES = {
     'full_grid': {'full_grid', 'net_metering', 'feed_in_tariff', 'self_consumption'},
     'limited_grid': {'limited_grid', 'self_consumption', 'off_grid'},
@@ -307,12 +315,11 @@ def _validate_energy_policy_config(config):
     if missing:
         raise ValueError(f"energy_policy config missing required keys: {sorted(missing)}")
 
-    valid_strategies = {'minimize_cost', 'minimize_grid_reliance', 'minimize_generator'}
     strat = config['strategy']
-    if strat not in valid_strategies:
+    if strat not in _VALID_STRATEGIES:
         raise ValueError(
             f"energy_policy strategy '{strat}' invalid. "
-            f"Must be one of: {sorted(valid_strategies)}"
+            f"Must be one of: {sorted(_VALID_STRATEGIES)}"
         )
 
     grid = config.get('grid', {})
@@ -373,7 +380,8 @@ def _resolve_export_rate(policy_grid, registry_paths):
     if fit_path is None:
         raise ValueError("feed_in_tariff CSV not found in registry")
 
-    df = pd.read_csv(fit_path, comment='#')
+    df = pd.read_csv(fit_path, comment='#', usecols=[
+        'project_size_category', 'date_effective', 'rate_usd_kwh_effective'])
     match = df[df['project_size_category'] == tier]
     if match.empty:
         raise ValueError(
@@ -773,20 +781,44 @@ def _finalize_energy_dispatch_row(row, battery_specs, battery_state):
 # Internal helpers — dispatch day
 # ---------------------------------------------------------------------------
 
+# Action priority per strategy. Resolved once per run into the dispatch
+# context so the daily loop never re-keys these tables by strategy name.
 _SURPLUS_ORDER = {
-    'minimize_cost': ['battery', 'export', 'curtail'],
-    'minimize_grid_reliance': ['battery', 'export', 'curtail'],
-    'minimize_generator': ['battery', 'export', 'curtail'],
+    'minimize_cost': ('battery', 'export', 'curtail'),
+    'minimize_grid_reliance': ('battery', 'export', 'curtail'),
+    'minimize_generator': ('battery', 'export', 'curtail'),
 }
 
 _DEFICIT_ORDER = {
-    'minimize_cost': ['battery', 'grid', 'generator'],
-    'minimize_grid_reliance': ['battery', 'generator', 'grid'],
-    'minimize_generator': ['battery', 'grid', 'generator'],
+    'minimize_cost': ('battery', 'grid', 'generator'),
+    'minimize_grid_reliance': ('battery', 'generator', 'grid'),
+    'minimize_generator': ('battery', 'grid', 'generator'),
 }
 
+assert set(_SURPLUS_ORDER) == set(_DEFICIT_ORDER) == set(_VALID_STRATEGIES), (
+    "Dispatch order tables must cover exactly the valid energy strategies")
+
+
+def _available_actions(order, battery_specs, generator_specs):
+    """Drop dispatch actions whose equipment is not installed.
+
+    Args:
+        order: Action tuple from _SURPLUS_ORDER or _DEFICIT_ORDER.
+        battery_specs: Battery specs dict or None.
+        generator_specs: Generator specs dict or None.
+
+    Returns:
+        Tuple of actions in the same priority order.
+    """
+    missing = set()
+    if battery_specs is None:
+        missing.add('battery')
+    if generator_specs is None:
+        missing.add('generator')
+    return tuple(a for a in order if a not in missing)
+
 
-def _handle_surplus(surplus, strategy, row, battery_specs, battery_state,
+def _handle_surplus(surplus, order, row, battery_specs, battery_state,
                     grid_mode, grid_cap_state):
     """Dispatch renewable surplus through battery, export, and curtailment.
 
@@ -794,7 +826,7 @@ def _handle_surplus(surplus, strategy, row, battery_specs, battery_state,
 
     Args:
         surplus: Surplus energy in kWh (positive).
-        strategy: Dispatch strategy string.
+        order: Installed surplus actions in priority order (see _available_actions).
         row: Mutable row dict to update with dispatch results.
         battery_specs: Battery specs dict or None.
         battery_state: Mutable battery state dict.
@@ -804,11 +836,11 @@ def _handle_surplus(surplus, strategy, row, battery_specs, battery_state,
     row['renewable_surplus_kwh'] = surplus
     remaining = surplus
 
-    for action in _SURPLUS_ORDER[strategy]:
+    for action in order:
         if remaining <= 0:
             break
 
-        if action == 'battery' and battery_specs is not None:
+        if action == 'battery':
             accepted, stored = _charge_battery(
                 remaining, battery_specs, battery_state, renewable=True)
             row['battery_charge_kwh'] += accepted
@@ -826,7 +858,7 @@ def _handle_surplus(surplus, strategy, row, battery_specs, battery_state,
             remaining = 0.0
 
 
-def _handle_deficit(deficit, strategy, row, battery_specs, battery_state,
+def _handle_deficit(deficit, order, row, battery_specs, battery_state,
                     generator_specs, grid_mode, grid_cap_state):
     """Fulfill energy deficit through battery, grid, and generator.
 
@@ -834,7 +866,7 @@ def _handle_deficit(deficit, strategy, row, battery_specs, battery_state,
 
     Args:
         deficit: Deficit energy in kWh (positive).
-        strategy: Dispatch strategy string.
+        order: Installed deficit actions in priority order (see _available_actions).
         row: Mutable row dict to update with dispatch results.
         battery_specs: Battery specs dict or None.
         battery_state: Mutable battery state dict.
@@ -844,11 +876,11 @@ def _handle_deficit(deficit, strategy, row, battery_specs, battery_state,
     """
     remaining = deficit
 
-    for action in _DEFICIT_ORDER[strategy]:
+    for action in order:
         if remaining <= 0:
             break
 
-        if action == 'battery' and battery_specs is not None:
+        if action == 'battery':
             delivered, soc_draw, ren_del = _discharge_battery(
                 remaining, battery_specs, battery_state)
             row['battery_discharge_kwh'] += delivered
@@ -861,7 +893,7 @@ def _handle_deficit(deficit, strategy, row, battery_specs, battery_state,
             row['grid_import_kwh'] += imported
             remaining -= imported
 
-        elif action == 'generator' and generator_specs is not None:
+        elif action == 'generator':
             delivered, excess, fuel, hours = _run_generator(
                 remaining, generator_specs)
             row['generator_kwh'] += delivered
@@ -895,9 +927,9 @@ def _dispatch_day(day, total_demand_kwh, community_demand_kwh, water_demand_kwh,
         total_solar_kwh: Solar subtotal (pass-through).
         total_wind_kwh: Wind subtotal (pass-through).
         ctx: Dispatch context dict with keys: battery_specs, generator_specs,
-            battery_state, strategy, grid_mode, grid_cap_state,
-            net_metering_state, ag_tariff, commercial_tariff, diesel_price,
-            export_rate.
+            battery_state, strategy, surplus_order, deficit_order, grid_mode,
+            grid_cap_state, net_metering_state, ag_tariff, commercial_tariff,
+            diesel_price, export_revenue_rate.
 
     Returns:
         Tuple of (row_dict, battery_state).
@@ -918,10 +950,10 @@ def _dispatch_day(day, total_demand_kwh, community_demand_kwh, water_demand_kwh,
     row['renewable_consumed_kwh'] = min(total_renewable_kwh, total_demand_kwh)
 
     if net_load <= 0:
-        _handle_surplus(-net_load, strategy, row, battery_specs, battery_state,
+        _handle_surplus(-net_load, ctx['surplus_order'], row, battery_specs, battery_state,
                         grid_mode, ctx['grid_cap_state'])
     else:
-        _handle_deficit(net_load, strategy, row, battery_specs, battery_state,
+        _handle_deficit(net_load, ctx['deficit_order'], row, battery_specs, battery_state,
                         ctx['generator_specs'], grid_mode, ctx['grid_cap_state'])
 
     # --- Costs ---
@@ -939,12 +971,8 @@ def _dispatch_day(day, total_demand_kwh, community_demand_kwh, water_demand_kwh,
             total_demand_kwh, ctx['ag_tariff'], ctx['commercial_tariff']
         )
 
-    if grid_mode == 'feed_in_tariff':
-        row['grid_export_revenue'] = row['grid_export_kwh'] * ctx['export_rate']
-    elif grid_mode == 'net_metering':
-        row['grid_export_revenue'] = 0.0
-    else:
-        row['grid_export_revenue'] = 0.0
+    # Zero outside feed-in tariff mode (see _run_simulation)
+    row['grid_export_revenue'] = row['grid_export_kwh'] * ctx['export_revenue_rate']
 
     _finalize_energy_dispatch_row(row, battery_specs, battery_state)
 
@@ -989,7 +1017,7 @@ def _run_simulation(energy_df, demand_df, water_energy_series,
     Args:
         energy_df: Renewable generation DataFrame with day, total_solar_kwh, etc.
         demand_df: Community demand DataFrame with day, total_community_energy_kwh.
-        water_energy_series: Dict of daily water energy demand keyed by Timestamp.
+        water_energy_series: Series of daily water energy demand indexed by date.
         battery_specs: Battery specs dict or None.
         generator_specs: Generator specs dict or None.
         policy_config: Parsed energy policy dict.
@@ -1043,10 +1071,15 @@ def _run_simulation(energy_df, demand_df, water_energy_series,
         'generator_specs': generator_specs,
         'battery_state': battery_state,
         'strategy': strategy,
+        'surplus_order': _available_actions(
+            _SURPLUS_ORDER[strategy], battery_specs, generator_specs),
+        'deficit_order': _available_actions(
+            _DEFICIT_ORDER[strategy], battery_specs, generator_specs),
         'grid_mode': grid_mode,
         'grid_cap_state': grid_cap_state,
         'net_metering_state': net_metering_state,
-        'export_rate': export_rate,
+        # Only feed-in tariff mode is paid for exports
+        'export_revenue_rate': export_rate if grid_mode == 'feed_in_tariff' else 0.0,
     }
 
     # Index energy and demand DataFrames by day for lookup
@@ -1059,10 +1092,23 @@ def _run_simulation(energy_df, demand_df, water_energy_series,
     if demand_lookup.index.duplicated().any():
         raise ValueError("Duplicate dates in community demand data")
 
+    # Pull each daily input into a plain array once so the loop indexes
+    # positions instead of doing a label lookup per day (missing dates
+    # still raise KeyError here)
+    energy_days = energy_lookup.loc[dates]
+    total_solar_arr = energy_days['total_solar_kwh'].to_numpy()
+    total_wind_arr = energy_days['total_wind_kwh'].to_numpy()
+    total_renewable_arr = energy_days['total_renewable_kwh'].to_numpy()
+    community_demand_arr = demand_lookup.loc[dates, 'total_community_energy_kwh'].to_numpy()
+    water_demand_arr = water_energy_series.loc[dates].to_numpy()
+    ag_tariff_arr = ag_price_daily.loc[dates].to_numpy()
+    commercial_tariff_arr = commercial_price_daily.loc[dates].to_numpy()
+    diesel_price_arr = diesel_price_daily.loc[dates].to_numpy()
+
     current_month = None
     rows = []
 
-    for day in dates:
+    for i, day in enumerate(dates):
         day_ts = pd.Timestamp(day)
 
         # Month boundary reset
@@ -1079,20 +1125,17 @@ def _run_simulation(energy_df, demand_df, water_energy_series,
         grid_cap_state['export']['day'] = day_ts
 
         # Look up daily values
-        e_row = energy_lookup.loc[day_ts]
-        total_solar = e_row['total_solar_kwh']
-        total_wind = e_row['total_wind_kwh']
-        total_renewable = e_row['total_renewable_kwh']
+        total_solar = total_solar_arr[i]
+        total_wind = total_wind_arr[i]
+        total_renewable = total_renewable_arr[i]
+        community_demand = community_demand_arr[i]
 
-        d_row = demand_lookup.loc[day_ts]
-        community_demand = d_row['total_community_energy_kwh']
-
-        water_demand = water_energy_series[day_ts]
+        water_demand = water_demand_arr[i]
         total_demand = community_demand + water_demand
 
-        ctx['ag_tariff'] = ag_price_daily.loc[day_ts]
-        ctx['commercial_tariff'] = commercial_price_daily.loc[day_ts]
-        ctx['diesel_price'] = diesel_price_daily.loc[day_ts]
+        ctx['ag_tariff'] = ag_tariff_arr[i]
+        ctx['commercial_tariff'] = commercial_tariff_arr[i]
+        ctx['diesel_price'] = diesel_price_arr[i]
 
         row, battery_state = _dispatch_day(
             day=day_ts,
@@ -1226,22 +1269,21 @@ def compute_daily_energy_balance(energy_config_path, energy_policy_path,
         water_energy = pd.Series(dtype=float)
 
     # 4. Date intersection
-    energy_dates = set(energy_df['day'])
-    demand_dates = set(demand_df['day'])
-    common_dates = energy_dates & demand_dates
+    energy_dates = pd.DatetimeIndex(energy_df['day'])
+    demand_dates = pd.DatetimeIndex(demand_df['day'])
+    dates = energy_dates.intersection(demand_dates)
     if water_balance_df is not None:
-        water_dates = set(water_balance_df['day'])
-        common_dates = common_dates & water_dates
+        water_dates = pd.DatetimeIndex(water_balance_df['day'])
+        dates = dates.intersection(water_dates)
 
-    common_dates = sorted(common_dates)
-    if not common_dates:
+    dates = dates.unique().sort_values()
+    if dates.empty:
         raise ValueError(
             'No overlapping dates between input sources. '
-            f'Energy: {min(energy_dates).date()}–{max(energy_dates).date()}, '
-            f'Demand: {min(demand_dates).date()}–{max(demand_dates).date()}'
-            + (f', Water: {min(water_dates).date()}–{max(water_dates).date()}' if water_balance_df is not None else '')
+            f'Energy: {energy_dates.min().date()}–{energy_dates.max().date()}, '
+            f'Demand: {demand_dates.min().date()}–{demand_dates.max().date()}'
+            + (f', Water: {water_dates.min().date()}–{water_dates.max().date()}' if water_balance_df is not None else '')
         )
-    dates = pd.DatetimeIndex(common_dates)
 
     energy_df = energy_df[energy_df['day'].isin(dates)].reset_index(drop=True)
     demand_df = demand_df[demand_df['day'].isin(dates)].reset_index(drop=True)
@@ -1249,7 +1291,7 @@ def compute_daily_energy_balance(energy_config_path, energy_policy_path,
     # 5. Load configs
     energy_config = _load_yaml(energy_config_path)
     policy_config = _load_yaml(energy_policy_path)
-    registry = _load_yaml(registry_path)
+    registry = load_registry(registry_path)
     paths = _resolve_energy_balance_paths(registry, root_dir)
 
     # 5b. Validate configs
@@ -1291,17 +1333,15 @@ def compute_daily_energy_balance(energy_config_path, energy_policy_path,
     # 10. Cap enforcement
     look_ahead = policy_config.get('cap_enforcement', {}).get('look_ahead', True)
 
-    # Water energy as a lookup dict (KeyError on missing days catches alignment bugs)
-    if not water_energy.empty:
-        water_energy_lookup = water_energy.to_dict()
-    else:
-        water_energy_lookup = {d: 0.0 for d in dates}
+    # Water energy by date (KeyError on missing days catches alignment bugs)
+    if water_energy.empty:
+        water_energy = pd.Series(0.0, index=dates)
 
     # 11. Run simulation
     result = _run_simulation(
         energy_df=energy_df,
         demand_df=demand_df,
-        water_energy_series=water_energy_lookup,
+        water_energy_series=water_energy,
         battery_specs=battery_specs,
         generator_specs=generator_specs,
         policy_config=policy_config,
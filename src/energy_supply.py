@@ -22,6 +22,8 @@ from pathlib import Path
 import pandas as pd
 import yaml
 
+from src.data_loaders import load_daily_csv, load_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,10 +38,8 @@ def _load_yaml(path):
 
 
 def _load_csv(path):
-    """Load CSV, skipping comment lines that start with '#', parsing 'date' column."""
-    df = pd.read_csv(path, comment='#', parse_dates=['date'])
-    df = df.drop(columns=['weather_scenario_id'], errors='ignore')
-    return df
+    """Load an energy output CSV via the shared daily loader, without the scenario id."""
+    return load_daily_csv(path).drop(columns=['weather_scenario_id'], errors='ignore')
 
 
 def _resolve_energy_paths(registry, root_dir):
@@ -74,7 +74,7 @@ def _scale_solar(pv_df, solar_config):
         f'{key}_comm_solar_kwh': pv_df[f'{key}_kwh_per_ha'] * cfg['area_ha']
         for key, cfg in solar_config.items()
     }
-    return pd.DataFrame(cols)
+    return pd.DataFrame(cols, index=pv_df.index)
 
 
 def _scale_wind(wind_df, wind_config):
@@ -96,7 +96,7 @@ def _scale_wind(wind_df, wind_config):
         f'{key}_wind_kwh': wind_df[f'{key}_kwh'] * cfg['number']
         for key, cfg in wind_config.items()
     }
-    return pd.DataFrame(cols)
+    return pd.DataFrame(cols, index=wind_df.index)
 
 
 def _extract_agripv_farms(farm_config):
@@ -229,7 +229,7 @@ def compute_daily_energy(config_path, registry_path, *, farm_profiles_path=None,
         root_dir = Path(registry_path).parent.parent
 
     config = _load_yaml(config_path)
-    registry = _load_yaml(registry_path)
+    registry = load_registry(registry_path)
     paths = _resolve_energy_paths(registry, root_dir)
 
     solar_config = config.get('community_solar') or {}
@@ -247,38 +247,19 @@ def compute_daily_energy(config_path, registry_path, *, farm_profiles_path=None,
     else:
         agripv = pd.DataFrame()
 
+    # Every source is a column block over the same PV date rows, so the
+    # blocks are placed side by side rather than hash-joined on 'day'
     day = pv_df['date'].rename('day')
-    community_solar = community_solar.assign(day=day.values)
-    wind = wind.assign(day=day.values)
-
-    parts = [community_solar]
-    if not agripv.empty:
-        agripv = agripv.assign(day=day.values)
-        parts.insert(0, agripv)
-    parts.append(wind)
-
-    df = parts[0]
-    for part in parts[1:]:
-        df = df.merge(part, on='day', validate='one_to_one')
-
-    expected_rows = len(pv_df)
-    if len(df) < expected_rows:
-        drop_pct = (expected_rows - len(df)) / expected_rows * 100
-        msg = (f'Energy date merge dropped {expected_rows - len(df)} rows '
-               f'({drop_pct:.1f}%) — PV and wind data have different date ranges')
-        if drop_pct > 5:
-            raise ValueError(msg)
-        logger.warning(msg)
-
-    # Reorder: day first, then agripv, community solar, wind
-    agripv_cols = [c for c in agripv.columns if c != 'day'] if not agripv.empty else []
-    col_order = ['day'] + agripv_cols
-    col_order += [c for c in community_solar.columns if c != 'day']
-    col_order += [c for c in wind.columns if c != 'day']
-    df = df[col_order]
-
-    solar_cols = agripv_cols + [c for c in community_solar.columns if c != 'day']
-    wind_cols = [c for c in wind.columns if c != 'day']
+    agripv_cols = list(agripv.columns)
+    parts = [day.to_frame()]
+    if agripv_cols:
+        parts.append(agripv.set_axis(day.index))
+    parts.append(community_solar.set_axis(day.index))
+    parts.append(wind.set_axis(day.index))
+    df = pd.concat(parts, axis=1)
+
+    solar_cols = agripv_cols + list(community_solar.columns)
+    wind_cols = list(wind.columns)
 
     if degradation_rate and degradation_rate > 0:
         start = pd.Timestamp(degradation_start) if degradation_start else df['day'].iloc[0]
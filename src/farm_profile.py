@@ -47,8 +47,8 @@ def _load_season_lengths(registry, root_dir):
     windows_path = root_dir / registry["crops"]["planting_windows"]
     df = pd.read_csv(windows_path, comment="#")
     lookup = {}
-    for _, row in df.iterrows():
-        lookup[(row["crop"], row["planting_date_mmdd"])] = int(row["expected_season_length_days"])
+    for row in df.itertuples(index=False):
+        lookup[(row.crop, row.planting_date_mmdd)] = int(row.expected_season_length_days)
     return lookup
 
 
@@ -58,8 +58,8 @@ def _make_solar_shape():
     spans hours 6–18 with a raised-cosine envelope.
     """
     shape = np.zeros(24)
-    for h in range(6, 19):
-        shape[h] = np.cos((h - 12) / 6.5 * np.pi / 2) ** 2
+    hours = np.arange(6, 19)
+    shape[hours] = np.cos((hours - 12) / 6.5 * np.pi / 2) ** 2
     return shape / shape.sum()
 
 
@@ -69,8 +69,7 @@ def _make_wind_shape():
     Desert sites see modestly higher winds in afternoon from thermal
     convection. Variation is ~15% around the mean.
     """
-    shape = np.array([1.0 + 0.15 * np.sin((h - 6) / 24 * 2 * np.pi)
-                       for h in range(24)])
+    shape = 1.0 + 0.15 * np.sin((np.arange(24) - 6) / 24 * 2 * np.pi)
     return shape / shape.sum()
 
 
@@ -126,11 +125,57 @@ _WATER_SCHEDULES = {
 # ---------------------------------------------------------------------------
 
 def _subset_years(df, years):
-    """Subset DataFrame to first N years. None returns all data."""
+    """Subset DataFrame to first N years. None returns all data.
+
+    Callers only read the result, so no copy is made. When 'day' is sorted the
+    window is a prefix and is sliced positionally instead of via a full mask.
+    """
     if years is None:
-        return df.copy()
-    start_year = df['day'].dt.year.min()
-    return df[df['day'].dt.year < start_year + years].copy()
+        return df
+    days = df['day']
+    if len(days) and days.is_monotonic_increasing:
+        end = days.searchsorted(pd.Timestamp(year=days.iloc[0].year + years, month=1, day=1))
+        return df.iloc[:end]
+    return df[days.dt.year < days.dt.year.min() + years]
+
+
+def _simulate_soc(net_h, soc_init_kwh, soc_min_kwh, soc_max_kwh):
+    """Run the hour-by-hour battery SOC simulation for many days at once.
+
+    Every day starts from soc_init_kwh, so days are independent and the
+    24-hour recurrence is stepped for all days together.
+
+    Args:
+        net_h: Array of shape (days, 24), demand minus generation in kWh.
+            Positive hours discharge the battery, others charge it.
+        soc_init_kwh: SOC at the start of each day.
+        soc_min_kwh: SOC floor in kWh.
+        soc_max_kwh: SOC ceiling in kWh.
+
+    Returns:
+        Tuple of (soc_h, unmet_deficit, uncaptured_surplus) where soc_h has
+        the same shape as net_h (SOC after each hour) and the other two are
+        per-day totals in kWh.
+    """
+    n_days = net_h.shape[0]
+    soc = np.full(n_days, soc_init_kwh, dtype=float)
+    soc_h = np.empty_like(net_h, dtype=float)
+    unmet_deficit = np.zeros(n_days)
+    uncaptured_surplus = np.zeros(n_days)
+
+    for h in range(24):
+        net = net_h[:, h]
+        deficit = net > 0
+        # Deficit: discharge battery down to the floor
+        discharged = np.where(deficit, np.minimum(net, soc - soc_min_kwh), 0.0)
+        # Surplus: charge battery up to the ceiling
+        absorbed = np.where(deficit, 0.0, np.minimum(-net, soc_max_kwh - soc))
+        unmet_deficit += np.where(deficit, net - discharged, 0.0)
+        uncaptured_surplus += np.where(deficit, 0.0, -net - absorbed)
+        soc = soc - discharged + absorbed
+        soc_h[:, h] = soc
+
+    return soc_h, unmet_deficit, uncaptured_surplus
 
 
 def estimate_intraday_balance(energy_balance_df, *, battery_capacity_kwh,
@@ -176,90 +221,60 @@ def estimate_intraday_balance(energy_balance_df, *, battery_capacity_kwh,
     usable = soc_max_kwh - soc_min_kwh
     soc_init_kwh = (soc_min_kwh + soc_max_kwh) / 2
 
-    hourly_rows = []
-    daily_rows = []
-
-    for _, row in sub.iterrows():
-        day = row['day']
-        solar_daily = row['total_solar_kwh']
-        wind_daily = row['total_wind_kwh']
-        building_daily = row['community_energy_demand_kwh']
-        water_daily = row['water_energy_demand_kwh']
-
-        # Decompose to hourly via shape factors
-        solar_h = solar_daily * _SOLAR
-        wind_h = wind_daily * _WIND
-        gen_h = solar_h + wind_h
-
-        building_h = building_daily * _BUILDING
-        water_h = water_daily * _WATER
-        demand_h = building_h + water_h
-
-        # Positive net = deficit (demand > generation), negative = surplus
-        net_h = demand_h - gen_h
-        cumulative = np.cumsum(net_h)
-        swing = cumulative.max() - cumulative.min()
-
-        # Hour-by-hour SOC simulation
-        soc = soc_init_kwh
-        unmet_deficit = 0.0
-        uncaptured_surplus = 0.0
-        floor_hours = 0
-        ceiling_hours = 0
-
-        for h in range(24):
-            if net_h[h] > 0:
-                # Deficit: discharge battery
-                available = soc - soc_min_kwh
-                discharged = min(net_h[h], available)
-                unmet = net_h[h] - discharged
-                soc -= discharged
-                unmet_deficit += unmet
-            else:
-                # Surplus: charge battery
-                headroom = soc_max_kwh - soc
-                absorbed = min(-net_h[h], headroom)
-                uncaptured = (-net_h[h]) - absorbed
-                soc += absorbed
-                uncaptured_surplus += uncaptured
-                unmet = 0.0
-
-            if soc <= soc_min_kwh + 0.01:
-                floor_hours += 1
-            if soc >= soc_max_kwh - 0.01:
-                ceiling_hours += 1
-
-            hourly_rows.append({
-                'day': day,
-                'hour': h,
-                'est_solar_kwh': solar_h[h],
-                'est_wind_kwh': wind_h[h],
-                'est_generation_kwh': gen_h[h],
-                'est_building_demand_kwh': building_h[h],
-                'est_water_demand_kwh': water_h[h],
-                'est_demand_kwh': demand_h[h],
-                'est_net_kwh': net_h[h],
-                'est_cumulative_net_kwh': cumulative[h],
-                'est_battery_soc_kwh': soc,
-            })
-
-        daily_rows.append({
-            'day': day,
-            'intraday_swing_kwh': swing,
-            'usable_capacity_kwh': usable,
-            'unmet_deficit_kwh': unmet_deficit,
-            'uncaptured_surplus_kwh': uncaptured_surplus,
-            'intraday_sufficient': unmet_deficit < 0.01,
-            'floor_hours': floor_hours,
-            'ceiling_hours': ceiling_hours,
-            'peak_surplus_kw': max(-net_h.min(), 0),
-            'peak_deficit_kw': max(net_h.max(), 0),
-            'daily_generation_kwh': solar_daily + wind_daily,
-            'daily_demand_kwh': building_daily + water_daily,
-        })
-
-    hourly_df = pd.DataFrame(hourly_rows)
-    daily_df = pd.DataFrame(daily_rows)
+    days = sub['day'].to_numpy()
+    solar_daily = sub['total_solar_kwh'].to_numpy(dtype=float)
+    wind_daily = sub['total_wind_kwh'].to_numpy(dtype=float)
+    building_daily = sub['community_energy_demand_kwh'].to_numpy(dtype=float)
+    water_daily = sub['water_energy_demand_kwh'].to_numpy(dtype=float)
+
+    # Decompose to hourly via shape factors: one (days, 24) matrix per series
+    solar_h = np.outer(solar_daily, _SOLAR)
+    wind_h = np.outer(wind_daily, _WIND)
+    gen_h = solar_h + wind_h
+
+    building_h = np.outer(building_daily, _BUILDING)
+    water_h = np.outer(water_daily, _WATER)
+    demand_h = building_h + water_h
+
+    # Positive net = deficit (demand > generation), negative = surplus
+    net_h = demand_h - gen_h
+    cumulative = np.cumsum(net_h, axis=1)
+    swing = cumulative.max(axis=1) - cumulative.min(axis=1)
+
+    soc_h, unmet_deficit, uncaptured_surplus = _simulate_soc(
+        net_h, soc_init_kwh, soc_min_kwh, soc_max_kwh,
+    )
+    floor_hours = (soc_h <= soc_min_kwh + 0.01).sum(axis=1)
+    ceiling_hours = (soc_h >= soc_max_kwh - 0.01).sum(axis=1)
+
+    hourly_df = pd.DataFrame({
+        'day': np.repeat(days, 24),
+        'hour': np.tile(np.arange(24), len(days)),
+        'est_solar_kwh': solar_h.ravel(),
+        'est_wind_kwh': wind_h.ravel(),
+        'est_generation_kwh': gen_h.ravel(),
+        'est_building_demand_kwh': building_h.ravel(),
+        'est_water_demand_kwh': water_h.ravel(),
+        'est_demand_kwh': demand_h.ravel(),
+        'est_net_kwh': net_h.ravel(),
+        'est_cumulative_net_kwh': cumulative.ravel(),
+        'est_battery_soc_kwh': soc_h.ravel(),
+    })
+
+    daily_df = pd.DataFrame({
+        'day': days,
+        'intraday_swing_kwh': swing,
+        'usable_capacity_kwh': usable,
+        'unmet_deficit_kwh': unmet_deficit,
+        'uncaptured_surplus_kwh': uncaptured_surplus,
+        'intraday_sufficient': unmet_deficit < 0.01,
+        'floor_hours': floor_hours,
+        'ceiling_hours': ceiling_hours,
+        'peak_surplus_kw': np.maximum(-net_h.min(axis=1), 0),
+        'peak_deficit_kw': np.maximum(net_h.max(axis=1), 0),
+        'daily_generation_kwh': solar_daily + wind_daily,
+        'daily_demand_kwh': building_daily + water_daily,
+    })
 
     return hourly_df, daily_df
 
@@ -388,7 +403,7 @@ def plot_hourly_profiles():
     hours = np.arange(24)
 
     with _dark_mode_style():
-        fig, ax = plt.subplots(figsize=(10, 4.5))
+        fig, ax = plt.subplots(figsize=(10, 4.5), layout='constrained')
 
         ax.fill_between(hours, _SOLAR, alpha=0.15, color='#ffa726')
         ax.plot(hours, _SOLAR, color='#ffa726', linewidth=2, label='Solar Generation')
@@ -411,7 +426,6 @@ def plot_hourly_profiles():
         ax.legend(loc='upper left', fontsize=8)
         ax.grid(True, which='major', axis='both',
                 linestyle='--', linewidth=0.5, alpha=0.7)
-        fig.tight_layout()
 
     return fig
 
@@ -512,6 +526,12 @@ def plot_intraday_detail(hourly_df, daily_df, *, n_per_category=10,
     ncols = max(len(days) for _, days in categories)
     hours = np.arange(24)
 
+    # Index once so per-subplot lookups are O(1) instead of a full-frame filter
+    hourly_by_day = dict(tuple(hourly_df.groupby('day')))
+    daily_by_day = daily_df.set_index('day')
+    # Format every subplot's date label in one vectorized strftime pass
+    day_labels = dict(zip(daily_by_day.index, daily_by_day.index.strftime('%b %d')))
+
     with _dark_mode_style():
         fig, axes = plt.subplots(nrows, ncols,
                                   figsize=(3.2 * ncols, 3.2 * nrows),
@@ -528,8 +548,8 @@ def plot_intraday_detail(hourly_df, daily_df, *, n_per_category=10,
                     ax.set_visible(False)
                     continue
 
-                day = selected_days[col_idx]
-                day_h = hourly_df[hourly_df['day'] == day]
+                day = pd.Timestamp(selected_days[col_idx])
+                day_h = hourly_by_day[day]
 
                 solar = day_h['est_solar_kwh'].values
                 wind = day_h['est_wind_kwh'].values
@@ -537,31 +557,29 @@ def plot_intraday_detail(hourly_df, daily_df, *, n_per_category=10,
                 soc_trace = day_h['est_battery_soc_kwh'].values
 
                 # Stacked generation
-                ax.fill_between(hours, 0, solar, alpha=0.5, color='#ffa726', label='Solar')
-                ax.fill_between(hours, solar, solar + wind, alpha=0.5,
-                                color='#42a5f5', label='Wind')
+                ax.stackplot(hours, solar, wind, labels=['Solar', 'Wind'],
+                             colors=['#ffa726', '#42a5f5'], alpha=0.5)
                 ax.plot(hours, demand, color='#ef5350', linewidth=1.5, label='Demand')
 
                 # Battery SOC on secondary axis
                 ax2 = ax.twinx()
                 ax2.plot(hours, soc_trace, color='black', linewidth=1.2, alpha=0.8)
-                ax2.axhline(soc_max_kwh, color='black', linewidth=0.5,
-                            linestyle=':', alpha=0.4)
-                ax2.axhline(soc_min_kwh, color='black', linewidth=0.5,
-                            linestyle=':', alpha=0.4)
+                # Both SOC bounds as one LineCollection rather than two Line2D artists
+                ax2.hlines([soc_max_kwh, soc_min_kwh], 0, 23, colors='black',
+                           linewidth=0.5, linestyle=':', alpha=0.4)
                 ax2.set_ylim(0, battery_capacity_kwh)
                 ax2.tick_params(axis='y', labelsize=5, colors='black')
                 if col_idx == len(selected_days) - 1:
                     ax2.set_ylabel('SOC kWh', fontsize=5, color='black')
 
                 # Title with date and key metric
-                d_row = daily_df[daily_df['day'] == day].iloc[0]
+                d_row = daily_by_day.loc[day]
                 sufficient = d_row['intraday_sufficient']
                 title_color = '#66bb6a' if sufficient else '#ef5350'
                 unmet = d_row['unmet_deficit_kwh']
                 subtitle = (f"unmet {unmet:.0f}" if unmet > 0.01
                             else f"min SOC {soc_trace.min():.0f}")
-                ax.set_title(f"{pd.Timestamp(day).strftime('%b %d')}\n{subtitle}",
+                ax.set_title(f"{day_labels[day]}\n{subtitle}",
                              fontsize=7, color=title_color)
 
                 ax.set_xlim(0, 23)
@@ -587,27 +605,6 @@ def plot_intraday_detail(hourly_df, daily_df, *, n_per_category=10,
 # Load-shifting analysis
 # ---------------------------------------------------------------------------
 
-def _simulate_day_unmet(solar_daily, wind_daily, building_daily, water_daily,
-                        water_shape, soc_init_kwh, soc_min_kwh, soc_max_kwh):
-    """Run one day's hourly SOC simulation and return unmet deficit kWh."""
-    gen_h = solar_daily * _SOLAR + wind_daily * _WIND
-    demand_h = building_daily * _BUILDING + water_daily * water_shape
-    net_h = demand_h - gen_h
-
-    soc = soc_init_kwh
-    unmet_deficit = 0.0
-    for h in range(24):
-        if net_h[h] > 0:
-            available = soc - soc_min_kwh
-            discharged = min(net_h[h], available)
-            soc -= discharged
-            unmet_deficit += net_h[h] - discharged
-        else:
-            headroom = soc_max_kwh - soc
-            soc += min(-net_h[h], headroom)
-    return unmet_deficit
-
-
 def analyze_load_shifting(energy_balance_df, *, battery_capacity_kwh,
                           soc_min=0.2, soc_max=0.8, years=1):
     """Test whether shifting water pump scheduling reduces unmet battery deficit.
@@ -643,39 +640,35 @@ def analyze_load_shifting(energy_balance_df, *, battery_capacity_kwh,
         ])
 
     sub = _subset_years(energy_balance_df, years)
-    sub = sub.set_index('day')
+    src = sub.set_index('day').loc[insufficient['day']]
 
     soc_max_kwh = battery_capacity_kwh * soc_max
     soc_min_kwh = battery_capacity_kwh * soc_min
     soc_init_kwh = (soc_min_kwh + soc_max_kwh) / 2
 
-    rows = []
-    for _, d_row in insufficient.iterrows():
-        day = d_row['day']
-        src = sub.loc[day]
-        solar = src['total_solar_kwh']
-        wind = src['total_wind_kwh']
-        building = src['community_energy_demand_kwh']
-        water = src['water_energy_demand_kwh']
-
-        results = {}
-        for name, shape in _WATER_SCHEDULES.items():
-            results[name] = _simulate_day_unmet(
-                solar, wind, building, water, shape,
-                soc_init_kwh, soc_min_kwh, soc_max_kwh,
-            )
-
-        best = min(results, key=results.get)
-        rows.append({
-            'day': day,
-            'baseline_unmet_kwh': results['morning'],
-            'midday_unmet_kwh': results['midday'],
-            'afternoon_unmet_kwh': results['afternoon'],
-            'best_schedule': best,
-            'savings_kwh': results['morning'] - results[best],
-        })
-
-    return pd.DataFrame(rows)
+    gen_h = (np.outer(src['total_solar_kwh'].to_numpy(dtype=float), _SOLAR)
+             + np.outer(src['total_wind_kwh'].to_numpy(dtype=float), _WIND))
+    building_h = np.outer(src['community_energy_demand_kwh'].to_numpy(dtype=float), _BUILDING)
+    water_daily = src['water_energy_demand_kwh'].to_numpy(dtype=float)
+
+    # Re-simulate every insufficient day under each schedule in one pass
+    names = list(_WATER_SCHEDULES)
+    unmet = np.vstack([
+        _simulate_soc(building_h + np.outer(water_daily, shape) - gen_h,
+                      soc_init_kwh, soc_min_kwh, soc_max_kwh)[1]
+        for shape in _WATER_SCHEDULES.values()
+    ])
+    best_idx = unmet.argmin(axis=0)
+    by_name = dict(zip(names, unmet))
+
+    return pd.DataFrame({
+        'day': insufficient['day'].to_numpy(),
+        'baseline_unmet_kwh': by_name['morning'],
+        'midday_unmet_kwh': by_name['midday'],
+        'afternoon_unmet_kwh': by_name['afternoon'],
+        'best_schedule': np.array(names, dtype=object)[best_idx],
+        'savings_kwh': by_name['morning'] - unmet[best_idx, np.arange(len(best_idx))],
+    })
 
 
 def plot_load_shifting(shift_df):
@@ -720,9 +713,8 @@ def plot_load_shifting(shift_df):
         ax1.set_ylabel('Days Resolved (deficit eliminated)')
         ax1.set_title(f'Insufficient Days Resolved\n({n_total} insufficient total)')
         ax1.set_ylim(0, max(n_total, 1) * 1.15)
-        for bar, val in zip(bars, [resolved[s] for s in schedules]):
-            ax1.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.3,
-                     str(val), ha='center', fontsize=10, fontweight='bold')
+        ax1.bar_label(bars, labels=[str(resolved[s]) for s in schedules],
+                      padding=3, fontsize=10, fontweight='bold')
 
         # Right: total unmet deficit
         bars2 = ax2.bar(schedules, [total_unmet[s] for s in schedules],
@@ -732,9 +724,7 @@ def plot_load_shifting(shift_df):
         ax2.yaxis.set_major_formatter(
             mticker.FuncFormatter(lambda x, _: f'{x:,.0f}')
         )
-        for bar, val in zip(bars2, [total_unmet[s] for s in schedules]):
-            ax2.text(bar.get_x() + bar.get_width() / 2, bar.get_height(),
-                     f'{val:,.0f}', ha='center', va='bottom', fontsize=8)
+        ax2.bar_label(bars2, fmt='{:,.0f}', fontsize=8)
 
         fig.suptitle('Water Pump Load Shifting — Impact on Battery Adequacy',
                      fontsize=11, fontweight='bold')
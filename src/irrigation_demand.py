@@ -24,6 +24,7 @@ import numpy as np
 import pandas as pd
 import yaml
 
+from src.data_loaders import load_growth_csv, load_registry
 from src.farm_profile import normalize_plantings, validate_no_overlap
 
 
@@ -59,10 +60,10 @@ def _load_irrigation_efficiency(path):
     """
     df = pd.read_csv(path, comment='#')
     lookup = {}
-    for _, row in df.iterrows():
-        full_name = row['irrigation_type']
-        lookup[full_name] = row['efficiency']
-        lookup[full_name.replace('_irrigation', '')] = row['efficiency']
+    for row in df.itertuples(index=False):
+        full_name = row.irrigation_type
+        lookup[full_name] = row.efficiency
+        lookup[full_name.replace('_irrigation', '')] = row.efficiency
     return lookup
 
 
@@ -83,8 +84,7 @@ def _load_daily_water_applied(growth_dir, crop, planting, condition, irrigation_
     etc_mm is the biological crop water need, identical across policies (used by yield model).
     One row per calendar date across all weather years (dates are unique).
     """
-    path = growth_dir / crop / f"{crop}_{planting}_{condition}-research.csv"
-    df = pd.read_csv(path, comment='#', parse_dates=['date'])
+    df = load_growth_csv(growth_dir, crop, planting, condition)
     df = df[df['irrigation_policy'] == irrigation_policy]
     result = df[['date', 'irrigation_mm', 'etc_mm']].copy()
     result['crop'] = crop
@@ -202,7 +202,7 @@ def compute_irrigation_demand(farm_profiles_path, registry_path, *,
         root_dir = Path(registry_path).parent.parent
 
     farm_config = _load_yaml(farm_profiles_path)
-    registry = _load_yaml(registry_path)
+    registry = load_registry(registry_path)
     validate_no_overlap(farm_config, registry, root_dir)
 
     growth_dir = root_dir / registry['crops']['daily_growth_dir']
@@ -233,8 +233,9 @@ def compute_irrigation_demand(farm_profiles_path, registry_path, *,
             freq='D',
         ),
     })
-    result = all_dates.copy()
+    date_index = pd.DatetimeIndex(all_dates['date'])
 
+    aligned = []
     demand_cols = []
     etc_cols = []
     etc_m3_cols = []
@@ -248,7 +249,10 @@ def compute_irrigation_demand(farm_profiles_path, registry_path, *,
         etc_cols.append(etc_col)
         etc_m3_cols.append(etc_m3_col)
         crop_cols.append(crop_col)
-        result = result.merge(fdf, on='date', how='left')
+        # Field dates are unique (no overlapping plantings), so a left merge
+        # onto the calendar is a plain index alignment
+        aligned.append(fdf.set_index('date').reindex(date_index).reset_index(drop=True))
+    result = pd.concat([all_dates] + aligned, axis=1)
 
     for col in demand_cols + etc_cols + etc_m3_cols:
         result[col] = result[col].fillna(0.0)
@@ -284,15 +288,15 @@ def get_field_irrigation_specs(farm_profiles_path, registry_path, *,
         root_dir = Path(registry_path).parent.parent
 
     farm_config = _load_yaml(farm_profiles_path)
-    registry = _load_yaml(registry_path)
+    registry = load_registry(registry_path)
     irrig_path = root_dir / registry['water_supply']['irrigation_systems']
 
     df = pd.read_csv(irrig_path, comment='#')
     energy_lookup = {}
-    for _, row in df.iterrows():
-        full_name = row['irrigation_type']
-        energy_lookup[full_name] = row['application_energy_kwh_per_m3']
-        energy_lookup[full_name.replace('_irrigation', '')] = row['application_energy_kwh_per_m3']
+    for row in df.itertuples(index=False):
+        full_name = row.irrigation_type
+        energy_lookup[full_name] = row.application_energy_kwh_per_m3
+        energy_lookup[full_name.replace('_irrigation', '')] = row.application_energy_kwh_per_m3
 
     fields = _collect_fields(farm_config, water_system_name)
     specs = {}
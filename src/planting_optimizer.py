@@ -32,6 +32,7 @@ import pandas as pd
 import yaml
 from scipy.optimize import minimize as scipy_minimize
 
+from src.data_loaders import load_growth_csv, load_registry
 from src.farm_profile import planting_code_to_mmdd
 
 
@@ -63,10 +64,10 @@ def _load_planting_windows(registry, root_dir):
 
     available = {}
     season_lengths = {}
-    for _, row in df.iterrows():
-        crop = row['crop']
-        mmdd = row['planting_date_mmdd']
-        season_lengths[(crop, mmdd)] = int(row['expected_season_length_days'])
+    for row in df.itertuples(index=False):
+        crop = row.crop
+        mmdd = row.planting_date_mmdd
+        season_lengths[(crop, mmdd)] = int(row.expected_season_length_days)
         mm, dd = mmdd.split('-')
         code = _MM_TO_ABBREV[mm] + dd
         available.setdefault(crop, []).append(code)
@@ -79,17 +80,16 @@ def _load_irrigation_efficiency(registry, root_dir):
     path = root_dir / registry['water_supply']['irrigation_systems']
     df = pd.read_csv(path, comment='#')
     lookup = {}
-    for _, row in df.iterrows():
-        name = row['irrigation_type']
-        lookup[name] = row['efficiency']
-        lookup[name.replace('_irrigation', '')] = row['efficiency']
+    for row in df.itertuples(index=False):
+        name = row.irrigation_type
+        lookup[name] = row.efficiency
+        lookup[name.replace('_irrigation', '')] = row.efficiency
     return lookup
 
 
 def _load_irrigation_curve(growth_dir, crop, planting, condition, irrigation_policy):
     """Load daily irrigation mm for one (crop, planting, condition) triple."""
-    path = growth_dir / crop / f"{crop}_{planting}_{condition}-research.csv"
-    df = pd.read_csv(path, comment='#', parse_dates=['date'])
+    df = load_growth_csv(growth_dir, crop, planting, condition)
     df = df[df['irrigation_policy'] == irrigation_policy]
     return df[['date', 'irrigation_mm']].copy()
 
@@ -545,7 +545,7 @@ def optimize_planting_schedule(farm_profiles_path, registry_path, *,
         root_dir = registry_path.parent.parent
 
     farm_config = _load_yaml(farm_profiles_path)
-    registry = _load_yaml(registry_path)
+    registry = load_registry(registry_path)
     available, season_lengths = _load_planting_windows(registry, root_dir)
     irrig_lookup = _load_irrigation_efficiency(registry, root_dir)
 
@@ -12,12 +12,15 @@ Usage:
 """
 
 import math
+from contextlib import contextmanager
 from datetime import datetime
 
+import matplotlib
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
 import numpy as np
+import pandas as pd
 from matplotlib.colors import BoundaryNorm, ListedColormap
 from matplotlib.patches import Patch
 
@@ -36,16 +39,29 @@ def _dark_mode_style():
 
 
 def _subset_years(df, years):
-    """Subset DataFrame to first N years. None = all years."""
+    """Subset DataFrame to first N years. None = all years.
+
+    Callers only read the result, so no copy is made. When 'day' is sorted the
+    window is a prefix and is sliced positionally instead of via a full mask.
+    """
     if years is None:
-        return df.copy()
-    start_year = df['day'].dt.year.min()
-    return df[df['day'].dt.year < start_year + years].copy()
+        return df
+    days = df['day']
+    if len(days) and days.is_monotonic_increasing:
+        end = days.searchsorted(pd.Timestamp(year=days.iloc[0].year + years, month=1, day=1))
+        return df.iloc[:end]
+    return df[days.dt.year < days.dt.year.min() + years]
+
+
+def _suffix_cols(columns, suffix):
+    """Return columns ending in suffix, excluding total columns."""
+    mask = columns.str.endswith(suffix) & ~columns.str.startswith('total_')
+    return list(columns[mask])
 
 
 def _demand_cols(df, suffix):
     """Return per-type demand columns for a given suffix, excluding total columns."""
-    return [c for c in df.columns if c.endswith(suffix) and not c.startswith('total_')]
+    return _suffix_cols(df.columns, suffix)
 
 
 def _gen_cols(df):
@@ -54,7 +70,7 @@ def _gen_cols(df):
     Keeps per-source columns (e.g. 'low_density_solar_kwh', 'small_turbine_wind_kwh')
     and drops aggregates ('total_solar_kwh', 'total_wind_kwh', 'total_renewable_kwh').
     """
-    return [c for c in df.columns if c.endswith('_kwh') and not c.startswith('total_')]
+    return _suffix_cols(df.columns, '_kwh')
 
 
 def _prettify_label(col, suffix):
@@ -65,6 +81,21 @@ def _prettify_label(col, suffix):
     return col.replace(suffix, '').replace('_', ' ').strip().title()
 
 
+def _apply_month_ticks(ax, xlim):
+    """Limit a date x-axis to xlim (matplotlib date numbers) with rotated month ticks."""
+    ax.set_xlim(*xlim)
+    ax.xaxis.set_major_locator(mdates.MonthLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%b'))
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right', fontsize=10.5)
+
+
+def _apply_concise_dates(ax):
+    """Let matplotlib pick date ticks on a multi-month axis, labelled with ConciseDateFormatter."""
+    locator = mdates.AutoDateLocator()
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+
+
 def _stacked_area(df, cols, suffix, ylabel, title, years):
     """Render a stacked area chart for a set of demand columns.
 
@@ -79,18 +110,18 @@ def _stacked_area(df, cols, suffix, ylabel, title, years):
     Returns:
         matplotlib Figure.
     """
-    if years is not None:
-        start_year = df['day'].dt.year.min()
-        df = df[df['day'].dt.year < start_year + years]
+    df = _subset_years(df, years)
     labels = [_prettify_label(c, suffix) for c in cols]
-    fig, ax = plt.subplots(figsize=(14, 5))
-    ax.stackplot(df['day'], [df[c] for c in cols], labels=labels)
+    fig, ax = plt.subplots(figsize=(14, 5), layout='constrained')
+    # Multi-year daily series: rasterize the fills so PDF/SVG exports stay small
+    ax.stackplot(df['day'].to_numpy(), df.loc[:, cols].to_numpy(dtype=float).T, labels=labels,
+                 rasterized=True)
     ax.set_title(title)
     ax.set_xlabel('Date')
+    _apply_concise_dates(ax)
     ax.set_ylabel(ylabel)
     ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f'{x:,.0f}'))
     ax.legend(loc='upper left', fontsize=8, ncol=2)
-    fig.tight_layout()
     return fig
 
 
@@ -98,6 +129,37 @@ def _stacked_area(df, cols, suffix, ylabel, title, years):
 # Public API
 # ---------------------------------------------------------------------------
 
+# Rendering settings for long daily line series: drop sub-pixel vertices
+# before stroking and split very long paths into chunks for Agg
+_FAST_RENDER_RC = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
+
+
+@contextmanager
+def fast_backend():
+    """Temporarily switch matplotlib to the non-interactive Agg backend.
+
+    Use for bulk, headless figure generation (e.g. saving many PNGs from a
+    script) where GUI/inline canvas overhead is wasted. Save figures inside
+    the block: switching backends back on exit closes all open figures.
+    Line paths are also simplified to pixel resolution while inside the block.
+
+    Usage:
+        with fast_backend():
+            plot_energy_balance(df, years=3).savefig('energy_balance.png')
+    """
+    previous = matplotlib.get_backend()
+    matplotlib.use('Agg', force=True)
+    try:
+        with matplotlib.rc_context(_FAST_RENDER_RC):
+            yield
+    finally:
+        matplotlib.use(previous, force=True)
+
+
 def plot_energy_demands(df, *, title='Community Daily Energy Demand', years=None):
     """Stacked area plot of daily energy demand by building and household type.
 
@@ -155,7 +217,9 @@ def plot_demands(df, *, energy_title='Community Daily Energy Demand', water_titl
     Returns:
         Tuple of (energy_fig, water_fig).
     """
-    return plot_energy_demands(df, title=energy_title, years=years), plot_water_demands(df, title=water_title, years=years)
+    # Slice the year window once and share it between both plots
+    df = _subset_years(df, years)
+    return plot_energy_demands(df, title=energy_title), plot_water_demands(df, title=water_title)
 
 
 # ---------------------------------------------------------------------------
@@ -174,7 +238,7 @@ def plot_water_demand_by_source(df, *, title='Daily Water Demand by Source', yea
         matplotlib Figure.
     """
     sub = _subset_years(df, years)
-    fig, ax = plt.subplots(figsize=(14, 5))
+    fig, ax = plt.subplots(figsize=(14, 5), layout='constrained')
     if 'irrigation_demand_m3' in sub.columns:
         ax.plot(sub['day'], sub['irrigation_demand_m3'], label='Irrigation', linewidth=1.0)
     if 'community_water_demand_m3' in sub.columns:
@@ -183,11 +247,11 @@ def plot_water_demand_by_source(df, *, title='Daily Water Demand by Source', yea
         ax.plot(sub['day'], sub['total_water_demand_m3'], label='Total', linewidth=1.0, linestyle='--')
     ax.set_title(title)
     ax.set_xlabel('Date')
+    _apply_concise_dates(ax)
     ax.set_ylabel('Water (m\u00b3/day)')
     ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f'{x:,.0f}'))
     ax.legend(loc='upper right')
     ax.set_ylim(bottom=0)
-    fig.tight_layout()
     return fig
 
 
@@ -203,26 +267,31 @@ def plot_water_supply_by_source(df, *, title='Daily Water Supply by Source', yea
         matplotlib Figure.
     """
     sub = _subset_years(df, years)
-    fig, ax = plt.subplots(figsize=(14, 5))
+    fig, ax = plt.subplots(figsize=(14, 5), layout='constrained')
     supply_cols = [
         ('gw_untreated_to_tank_m3', 'GW Untreated'),
         ('gw_treated_to_tank_m3', 'GW Treated'),
         ('municipal_to_tank_m3', 'Municipal (irrigation)'),
     ]
-    for col, label in supply_cols:
-        if col in sub.columns:
-            ax.plot(sub['day'], sub[col], label=label, linewidth=1.0)
+    present = [(col, label) for col, label in supply_cols if col in sub.columns]
+    if present:
+        # One plot call for all supply sources; lines take the usual color cycle
+        lines = ax.plot(sub['day'].to_numpy(),
+                        sub[[col for col, _ in present]].to_numpy(dtype=float),
+                        linewidth=1.0)
+        for line, (_, label) in zip(lines, present):
+            line.set_label(label)
     if 'municipal_community_m3' in sub.columns:
         ax.plot(sub['day'], sub['municipal_community_m3'], label='Municipal (community)', linewidth=1.0)
     if 'total_sourced_to_tank_m3' in sub.columns:
         ax.plot(sub['day'], sub['total_sourced_to_tank_m3'], label='Total to tank', linewidth=1.0, linestyle='--')
     ax.set_title(title)
     ax.set_xlabel('Date')
+    _apply_concise_dates(ax)
     ax.set_ylabel('Water (m\u00b3/day)')
     ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f'{x:,.0f}'))
     ax.legend(loc='upper right')
     ax.set_ylim(bottom=0)
-    fig.tight_layout()
     return fig
 
 
@@ -280,7 +349,8 @@ def plot_water_balance(df, *, years=1, ylim=None, hspace=0.35):
         if ylim is None:
             water_cols = [c for c in ['irrigation_demand_m3', 'total_sourced_to_tank_m3',
                                        'tank_volume_m3'] if c in sub.columns]
-            peak = max(sub[c].max() for c in water_cols) if water_cols else 250
+            # One reduction over the (days, cols) block instead of a scan per column
+            peak = np.nanmax(sub[water_cols].to_numpy(dtype=float)) if water_cols else 250
             ylim = math.ceil(peak / 250) * 250
         ax_balance.set_ylim(0, ylim)
         ax_balance.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f'{x:,.0f}'))
@@ -302,6 +372,8 @@ def plot_water_balance(df, *, years=1, ylim=None, hspace=0.35):
 
         # ---- Panels 3-5: Policy decision heatmaps ----
 
+        xlim = mdates.date2num([sub['day'].iloc[0], sub['day'].iloc[-1]])
+
         source_categories = ['none', 'tank_stock', 'gw_untreated', 'gw_treated', 'municipal', 'mixed']
         source_colors = ['#f0f0f0', '#9ecae1', '#a1d99b', '#31a354', '#fdae6b', '#9467bd']
         source_map = {cat: i for i, cat in enumerate(source_categories)}
@@ -327,8 +399,7 @@ def plot_water_balance(df, *, years=1, ylim=None, hspace=0.35):
             norm = BoundaryNorm(list(range(len(colors) + 1)), cmap.N)
             ax.imshow(vals.reshape(1, -1), aspect='auto', interpolation='nearest',
                       cmap=cmap, norm=norm,
-                      extent=[mdates.date2num(sub['day'].iloc[0]),
-                              mdates.date2num(sub['day'].iloc[-1]), 0, 1])
+                      extent=[*xlim, 0, 1])
             ax.set_yticks([])
             ax.set_ylabel(ylabel, fontsize=7)
             ax.set_facecolor('white')
@@ -338,16 +409,10 @@ def plot_water_balance(df, *, years=1, ylim=None, hspace=0.35):
         ax_src.set_title('Daily Water Policy Decisions')
 
         # Month labels on all panels
+        for ax in (ax_src, ax_flush, ax_deficit):
+            ax.xaxis_date()
         for ax in axes:
-            if ax in (ax_src, ax_flush, ax_deficit):
-                ax.xaxis_date()
-                ax.set_xlim(mdates.date2num(sub['day'].iloc[0]),
-                            mdates.date2num(sub['day'].iloc[-1]))
-            else:
-                ax.set_xlim(sub['day'].min(), sub['day'].max())
-            ax.xaxis.set_major_locator(mdates.MonthLocator())
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%b'))
-            plt.setp(ax.get_xticklabels(), rotation=45, ha='right', fontsize=10.5)
+            _apply_month_ticks(ax, xlim)
 
         fig.tight_layout()
         return fig
@@ -520,11 +585,9 @@ def plot_energy_balance(df, *, years=1, ylim=None, hspace=0.35, clip=True):
         ax_net.set_title('Cumulative Net Metering')
 
         # Month labels on all three panels
+        xlim = mdates.date2num([sub['day'].iloc[0], sub['day'].iloc[-1]])
         for ax in (ax_supply, ax_surplus, ax_net):
-            ax.set_xlim(sub['day'].min(), sub['day'].max())
-            ax.xaxis.set_major_locator(mdates.MonthLocator())
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%b'))
-            plt.setp(ax.get_xticklabels(), rotation=45, ha='right', fontsize=10.5)
+            _apply_month_ticks(ax, xlim)
 
         fig.tight_layout()
         return fig
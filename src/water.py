@@ -36,6 +36,8 @@ from pathlib import Path
 import pandas as pd
 import yaml
 
+from src.data_loaders import load_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,7 +83,7 @@ def _load_well_specs(system_config, pump_df):
     Returns:
         List of dicts, each with keys: name, depth_m, tds_ppm, pump_type,
         rated_flow_m3_hr, pump_efficiency, motor_kw, om_cost_per_year,
-        max_daily_m3.
+        max_daily_m3, extraction_col, tds_col, pumping_col.
     """
     pump_lookup = pump_df.set_index('pump_type').to_dict('index')
     wells = []
@@ -97,6 +99,10 @@ def _load_well_specs(system_config, pump_df):
             'motor_kw': pump['motor_kw'],
             'om_cost_per_year': pump['om_cost_per_year'],
             'max_daily_m3': pump['rated_flow_m3_hr'] * 24,
+            # Output column names, formatted once instead of on every dispatch day
+            'extraction_col': f'{w["name"]}_extraction_m3',
+            'tds_col': f'{w["name"]}_tds_ppm',
+            'pumping_col': f'{w["name"]}_pumping_kwh',
         })
     return wells
 
@@ -279,7 +285,7 @@ def _assign_well_extraction(wells, total_extraction, row):
     """
     dist = _well_distribution(wells, total_extraction)
     for w in wells:
-        row[f'{w["name"]}_extraction_m3'] = dist[w['name']]
+        row[w['extraction_col']] = dist[w['name']]
 
 
 def _compute_gw_energy_and_cost(wells, treatment_row, treated_product, row):
@@ -290,9 +296,9 @@ def _compute_gw_energy_and_cost(wells, treatment_row, treated_product, row):
     """
     total_pump_kwh = 0.0
     for w in wells:
-        vol = row.get(f'{w["name"]}_extraction_m3', 0.0)
+        vol = row.get(w['extraction_col'], 0.0)
         well_energy = _pumping_energy_kwh(vol, w['depth_m'], w['pump_efficiency'])
-        row[f'{w["name"]}_pumping_kwh'] = well_energy
+        row[w['pumping_col']] = well_energy
         total_pump_kwh += well_energy
     row['pumping_energy_kwh'] = total_pump_kwh
 
@@ -306,7 +312,7 @@ def _compute_gw_energy_and_cost(wells, treatment_row, treated_product, row):
 
     row['groundwater_cost'] = row.get('groundwater_cost', 0.0) + sum(
         w['om_cost_per_year'] / 365.0
-        for w in wells if row.get(f'{w["name"]}_extraction_m3', 0.0) > 0
+        for w in wells if row.get(w['extraction_col'], 0.0) > 0
     )
 
 
@@ -595,9 +601,9 @@ def _init_dispatch_row(wells, tds_req, treatment_throughput_m3_hr,
     """
     row = {}
     for w in wells:
-        row[f'{w["name"]}_extraction_m3'] = 0.0
-        row[f'{w["name"]}_tds_ppm'] = w['tds_ppm']
-        row[f'{w["name"]}_pumping_kwh'] = 0.0
+        row[w['extraction_col']] = 0.0
+        row[w['tds_col']] = w['tds_ppm']
+        row[w['pumping_col']] = 0.0
     row.update({
         'gw_untreated_to_tank_m3': 0.0,
         'gw_treated_to_tank_m3': 0.0,
@@ -681,8 +687,8 @@ def _prefill_tank(row, tank, wells, treatment, municipal,
 
     pf_row = {}
     for w in wells:
-        pf_row[f'{w["name"]}_extraction_m3'] = 0.0
-        pf_row[f'{w["name"]}_pumping_kwh'] = 0.0
+        pf_row[w['extraction_col']] = 0.0
+        pf_row[w['pumping_col']] = 0.0
     pf_row.update({
         'treatment_feed_m3': 0.0, 'treatment_reject_m3': 0.0,
         'treatment_energy_kwh': 0.0, 'pumping_energy_kwh': 0.0,
@@ -698,8 +704,8 @@ def _prefill_tank(row, tank, wells, treatment, municipal,
 
     if prefill_vol > 0:
         for w in wells:
-            row[f'{w["name"]}_extraction_m3'] += pf_row[f'{w["name"]}_extraction_m3']
-            row[f'{w["name"]}_pumping_kwh'] += pf_row[f'{w["name"]}_pumping_kwh']
+            row[w['extraction_col']] += pf_row[w['extraction_col']]
+            row[w['pumping_col']] += pf_row[w['pumping_col']]
         row['gw_untreated_to_tank_m3'] += pf_row['gw_untreated_to_tank_m3']
         row['gw_treated_to_tank_m3'] += pf_row['gw_treated_to_tank_m3']
         row['municipal_to_tank_m3'] += pf_row['municipal_to_tank_m3']
@@ -1006,8 +1012,8 @@ def _second_source_pass(demand_remaining, tds_req, wells, treatment, municipal,
 
     p2_row = {}
     for w in wells:
-        p2_row[f'{w["name"]}_extraction_m3'] = 0.0
-        p2_row[f'{w["name"]}_pumping_kwh'] = 0.0
+        p2_row[w['extraction_col']] = 0.0
+        p2_row[w['pumping_col']] = 0.0
     p2_row.update({
         'treatment_feed_m3': 0.0, 'treatment_reject_m3': 0.0,
         'treatment_energy_kwh': 0.0, 'pumping_energy_kwh': 0.0,
@@ -1022,8 +1028,8 @@ def _second_source_pass(demand_remaining, tds_req, wells, treatment, municipal,
 
     # Accumulate second-pass accounting into main row
     for w in wells:
-        row[f'{w["name"]}_extraction_m3'] += p2_row[f'{w["name"]}_extraction_m3']
-        row[f'{w["name"]}_pumping_kwh'] += p2_row[f'{w["name"]}_pumping_kwh']
+        row[w['extraction_col']] += p2_row[w['extraction_col']]
+        row[w['pumping_col']] += p2_row[w['pumping_col']]
     row['gw_untreated_to_tank_m3'] += p2_row['gw_untreated_to_tank_m3']
     row['gw_treated_to_tank_m3'] += p2_row['gw_treated_to_tank_m3']
     row['municipal_to_tank_m3'] += p2_row['municipal_to_tank_m3']
@@ -1106,8 +1112,8 @@ def _overnight_tds_refill(tank, next_tds_req, wells, treatment, municipal,
     # Use a scratch row to avoid overwriting daytime sourcing accounting
     on_row = {}
     for w in wells:
-        on_row[f'{w["name"]}_extraction_m3'] = 0.0
-        on_row[f'{w["name"]}_pumping_kwh'] = 0.0
+        on_row[w['extraction_col']] = 0.0
+        on_row[w['pumping_col']] = 0.0
     on_row.update({
         'treatment_feed_m3': 0.0, 'treatment_reject_m3': 0.0,
         'treatment_energy_kwh': 0.0, 'pumping_energy_kwh': 0.0,
@@ -1122,8 +1128,8 @@ def _overnight_tds_refill(tank, next_tds_req, wells, treatment, municipal,
 
     if sourced > 0:
         for w in wells:
-            row[f'{w["name"]}_extraction_m3'] += on_row[f'{w["name"]}_extraction_m3']
-            row[f'{w["name"]}_pumping_kwh'] += on_row[f'{w["name"]}_pumping_kwh']
+            row[w['extraction_col']] += on_row[w['extraction_col']]
+            row[w['pumping_col']] += on_row[w['pumping_col']]
         row['gw_untreated_to_tank_m3'] += on_row['gw_untreated_to_tank_m3']
         row['gw_treated_to_tank_m3'] += on_row['gw_treated_to_tank_m3']
         row['municipal_to_tank_m3'] += on_row['municipal_to_tank_m3']
@@ -1338,10 +1344,19 @@ def _run_simulation(demand_df, wells, treatment, municipal, tank_init, policy,
     current_month = None
     rows = []
 
-    tds_col = demand_df['crop_tds_requirement_ppm'].values
+    # Daily inputs as plain columns, indexed by position in the loop
+    day_col = demand_df['day'].tolist()
+    demand_col = demand_df['total_demand_m3'].to_numpy()
+    tds_col = demand_df['crop_tds_requirement_ppm'].to_numpy()
     n_days = len(demand_df)
     tds_look_ahead = policy.get('tds_look_ahead_days', 7) or n_days
 
+    prefill_days = policy.get('prefill_look_ahead_days', 0)
+    # Smoothing needs a longer look-ahead for fallow horizon checks
+    smoothing_horizon = policy.get('treatment_smoothing', {}).get(
+        'fallow_horizon_days', 0)
+    look_ahead_days = max(prefill_days, smoothing_horizon)
+
     # Pre-compute treatment target for smoothing strategy
     if policy.get('strategy') == 'maximize_treatment_efficiency':
         raw_gw_tds = _volume_weighted_tds(wells, sum(w['max_daily_m3'] for w in wells))
@@ -1365,8 +1380,7 @@ def _run_simulation(demand_df, wells, treatment, municipal, tank_init, policy,
                 target_info['feed_target_m3'] / max_daily_feed * 100,
                 target_info['source_target_m3'])
 
-    for i, (_, demand_row) in enumerate(demand_df.iterrows()):
-        day = demand_row['day']
+    for i, day in enumerate(day_col):
 
         if current_month != (day.year, day.month):
             current_month = (day.year, day.month)
@@ -1380,22 +1394,16 @@ def _run_simulation(demand_df, wells, treatment, municipal, tank_init, policy,
                 next_tds_req = tds_col[j]
                 break
 
-        prefill_days = policy.get('prefill_look_ahead_days', 0)
-        # Smoothing needs a longer look-ahead for fallow horizon checks
-        smoothing_horizon = policy.get('treatment_smoothing', {}).get(
-            'fallow_horizon_days', 0)
-        look_ahead_days = max(prefill_days, smoothing_horizon)
-
         upcoming_demands = []
         upcoming_tds = []
         if look_ahead_days > 0:
-            for j in range(i + 1, min(i + 1 + look_ahead_days, n_days)):
-                upcoming_demands.append(demand_df.iloc[j]['total_demand_m3'])
-                upcoming_tds.append(tds_col[j])
+            look_ahead_end = min(i + 1 + look_ahead_days, n_days)
+            upcoming_demands = list(demand_col[i + 1:look_ahead_end])
+            upcoming_tds = list(tds_col[i + 1:look_ahead_end])
 
         row, tank = _dispatch_day(
-            demand_m3=demand_row['total_demand_m3'],
-            tds_req=demand_row['crop_tds_requirement_ppm'],
+            demand_m3=float(demand_col[i]),
+            tds_req=float(tds_col[i]),
             next_tds_req=next_tds_req,
             wells=wells,
             treatment=treatment,
@@ -1462,7 +1470,7 @@ def compute_water_supply(water_systems_path, registry_path, irrigation_demand_df
         root_dir = Path(registry_path).parent.parent
 
     ws_config = _load_yaml(water_systems_path)
-    registry = _load_yaml(registry_path)
+    registry = load_registry(registry_path)
     paths = _resolve_water_paths(registry, root_dir)
 
     system = None
@@ -1571,9 +1579,9 @@ def compute_water_supply(water_systems_path, registry_path, irrigation_demand_df
 
     well_cols = []
     for w in wells:
-        well_cols.append(f'{w["name"]}_extraction_m3')
-        well_cols.append(f'{w["name"]}_tds_ppm')
-        well_cols.append(f'{w["name"]}_pumping_kwh')
+        well_cols.append(w['extraction_col'])
+        well_cols.append(w['tds_col'])
+        well_cols.append(w['pumping_col'])
 
     agg_cols = [
         'gw_untreated_to_tank_m3', 'gw_treated_to_tank_m3',
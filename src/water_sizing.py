@@ -30,8 +30,9 @@ from pathlib import Path
 
 import pandas as pd
 
+from src.data_loaders import load_registry
 from src.water import (
-    _load_yaml, _load_csv, _resolve_water_paths,
+    _load_csv, _resolve_water_paths,
     _load_well_specs, _load_treatment_lookup,
     _snap_tds_to_band, _blend_tds,
     _run_simulation,
@@ -794,7 +795,7 @@ def size_water_system(irrigation_demand_df, registry_path, *,
     """
     if root_dir is None:
         root_dir = Path(registry_path).parent.parent
-    registry = _load_yaml(registry_path)
+    registry = load_registry(registry_path)
     paths = _resolve_water_paths(registry, root_dir)
 
     well_df = _load_csv(paths['wells'])
@@ -971,7 +972,7 @@ def optimize_water_system(irrigation_demand_df, registry_path, *,
     """
     if root_dir is None:
         root_dir = Path(registry_path).parent.parent
-    registry = _load_yaml(registry_path)
+    registry = load_registry(registry_path)
     paths = _resolve_water_paths(registry, root_dir)
 
     well_df = _load_csv(paths['wells'])
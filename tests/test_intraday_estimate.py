@@ -0,0 +1,87 @@
+# Tests for the intraday battery SOC simulation (src/intraday_estimate.py)
+
+import unittest
+import numpy as np
+
+from src.intraday_estimate import _simulate_soc
+
+SOC_MIN_KWH = 20.0
+SOC_MAX_KWH = 80.0
+SOC_INIT_KWH = 50.0
+
+
+def _simulate_soc_loop(net_h, soc_init_kwh, soc_min_kwh, soc_max_kwh):
+    """Reference hour-by-hour SOC simulation, one day at a time."""
+    soc_h = np.empty_like(net_h, dtype=float)
+    unmet_deficit = np.zeros(net_h.shape[0])
+    uncaptured_surplus = np.zeros(net_h.shape[0])
+
+    for d, day_net in enumerate(net_h):
+        soc = soc_init_kwh
+        for h in range(24):
+            if day_net[h] > 0:
+                discharged = min(day_net[h], soc - soc_min_kwh)
+                soc -= discharged
+                unmet_deficit[d] += day_net[h] - discharged
+            else:
+                absorbed = min(-day_net[h], soc_max_kwh - soc)
+                soc += absorbed
+                uncaptured_surplus[d] += -day_net[h] - absorbed
+            soc_h[d, h] = soc
+
+    return soc_h, unmet_deficit, uncaptured_surplus
+
+
+def _assert_matches_loop(net_h):
+    """Check _simulate_soc against the reference loop for the same inputs."""
+    got = _simulate_soc(net_h, SOC_INIT_KWH, SOC_MIN_KWH, SOC_MAX_KWH)
+    expected = _simulate_soc_loop(net_h, SOC_INIT_KWH, SOC_MIN_KWH, SOC_MAX_KWH)
+    for name, g, e in zip(('soc_h', 'unmet_deficit', 'uncaptured_surplus'), got, expected):
+        np.testing.assert_allclose(g, e, rtol=0, atol=1e-9, err_msg=name)
+    return got
+
+
+class TestSimulateSocMatchesLoop(unittest.TestCase):
+
+    def test_random_days(self):
+        """Random hourly net loads large enough to hit both SOC bounds."""
+        rng = np.random.default_rng(42)
+        net_h = rng.normal(0.0, 25.0, size=(200, 24))
+        soc_h, _, _ = _assert_matches_loop(net_h)
+        self.assertTrue(np.isclose(soc_h, SOC_MIN_KWH).any())
+        self.assertTrue(np.isclose(soc_h, SOC_MAX_KWH).any())
+
+    def test_clamps_at_floor_and_ceiling(self):
+        """A day that crosses each bound more than once stays clamped.
+
+        Net load alternates between deficits and surpluses larger than the
+        usable band, so SOC is driven to the floor and to the ceiling twice.
+        """
+        day = np.zeros(24)
+        day[:8] = [40.0, 30.0, -70.0, -10.0, 90.0, 5.0, -100.0, -1.0]
+        net_h = np.vstack([day, np.zeros(24), -day])
+
+        soc_h, unmet, uncaptured = _assert_matches_loop(net_h)
+
+        expected_soc = [20.0, 20.0, 80.0, 80.0, 20.0, 20.0, 80.0, 80.0]
+        np.testing.assert_allclose(soc_h[0, :8], expected_soc)
+        self.assertEqual(int(np.isclose(soc_h[0], SOC_MIN_KWH).sum()), 4)
+        self.assertEqual(int(np.isclose(soc_h[0], SOC_MAX_KWH).sum()), 20)
+        # Unmet: 10 + 30 + 30 + 5; uncaptured: 10 + 10 + 40 + 1
+        self.assertAlmostEqual(unmet[0], 75.0)
+        self.assertAlmostEqual(uncaptured[0], 61.0)
+
+        # Idle day holds the initial SOC and leaves nothing unserved
+        np.testing.assert_allclose(soc_h[1], SOC_INIT_KWH)
+        self.assertEqual(unmet[1], 0.0)
+        self.assertEqual(uncaptured[1], 0.0)
+
+        # Mirrored day hits the ceiling first, then the floor
+        self.assertEqual(int(np.isclose(soc_h[2], SOC_MAX_KWH).sum()), 4)
+        self.assertEqual(int(np.isclose(soc_h[2], SOC_MIN_KWH).sum()), 20)
+        self.assertAlmostEqual(unmet[2], 61.0)
+        self.assertAlmostEqual(uncaptured[2], 75.0)
+
+
+if __name__ == '__main__':
+    unittest.main()